@@ -20,7 +20,9 @@ from .parser import (
     parse_hl7_message,
     parse_hl7_file_with_errors,
     parse_hl7_file_streaming,
+    parse_hl7_bytes,
     appointments_to_json,
+    appointments_to_json_stream,
 )
 
 from .models import Patient, Provider, Appointment
@@ -39,7 +41,9 @@ __all__ = [
     "parse_hl7_message",
     "parse_hl7_file_with_errors",
     "parse_hl7_file_streaming",
+    "parse_hl7_bytes",
     "appointments_to_json",
+    "appointments_to_json_stream",
     # Domain models
     "Patient",
     "Provider",
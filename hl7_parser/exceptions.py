@@ -4,6 +4,11 @@ Custom Exceptions for HL7 Parser
 This module defines specific exceptions for different error scenarios
 that can occur during HL7 message parsing. Clear error messages help
 with debugging and understanding what went wrong.
+
+The error text is only formatted when the exception is turned into a
+string. Files with many rejected messages (e.g. a feed full of ADT
+messages parsed with continue_on_error) don't pay for messages that
+are never printed.
 """
 
 
@@ -27,8 +32,10 @@ class InvalidMessageTypeError(HL7ParserError):
     def __init__(self, expected: str, actual: str):
         self.expected = expected
         self.actual = actual
-        message = f"Invalid message type. Expected '{expected}', got '{actual}'"
-        super().__init__(message)
+        super().__init__(expected, actual)
+
+    def __str__(self) -> str:
+        return f"Invalid message type. Expected '{self.expected}', got '{self.actual}'"
 
 
 class MissingSegmentError(HL7ParserError):
@@ -40,8 +47,10 @@ class MissingSegmentError(HL7ParserError):
 
     def __init__(self, segment_name: str):
         self.segment_name = segment_name
-        message = f"Required segment '{segment_name}' is missing from the message"
-        super().__init__(message)
+        super().__init__(segment_name)
+
+    def __str__(self) -> str:
+        return f"Required segment '{self.segment_name}' is missing from the message"
 
 
 class MalformedSegmentError(HL7ParserError):
@@ -55,8 +64,10 @@ class MalformedSegmentError(HL7ParserError):
     def __init__(self, segment_name: str, reason: str):
         self.segment_name = segment_name
         self.reason = reason
-        message = f"Malformed segment '{segment_name}': {reason}"
-        super().__init__(message)
+        super().__init__(segment_name, reason)
+
+    def __str__(self) -> str:
+        return f"Malformed segment '{self.segment_name}': {self.reason}"
 
 
 class InvalidHL7FormatError(HL7ParserError):
@@ -69,5 +80,7 @@ class InvalidHL7FormatError(HL7ParserError):
 
     def __init__(self, reason: str):
         self.reason = reason
-        message = f"Invalid HL7 format: {reason}"
-        super().__init__(message)
+        super().__init__(reason)
+
+    def __str__(self) -> str:
+        return f"Invalid HL7 format: {self.reason}"
@@ -25,10 +25,12 @@ Usage:
     appointment = parse_hl7_message(message_text)
 """
 
-from typing import List, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Iterable, List, Iterator, Optional, TextIO, Tuple
 import json
+import re
 
-from .models import Patient, Provider, Appointment
+from .models import Patient, Provider, Appointment, json_default
 from .exceptions import (
     HL7ParserError,
     InvalidMessageTypeError,
@@ -37,17 +39,53 @@ from .exceptions import (
     InvalidHL7FormatError,
 )
 from .segment_parsers import (
-    split_message_into_segments,
+    split_message_into_indexed_segments,
     get_segment,
     parse_msh_segment,
     parse_sch_segment,
     parse_pid_segment,
     parse_pv1_segment,
+    read_msh_delimiters,
+    STANDARD_MSH_HEADER,
 )
 
 
 # Supported message type
 SUPPORTED_MESSAGE_TYPE = "SIU^S12"
+SUPPORTED_MESSAGE_TYPE_PREFIX = SUPPORTED_MESSAGE_TYPE.casefold()
+
+# Segment names looked up in every message
+MSH = "MSH"
+SCH = "SCH"
+PID = "PID"
+PV1 = "PV1"
+
+# Fallbacks for patient and provider fields that are not present
+UNKNOWN_ID = "UNKNOWN"
+UNKNOWN_PROVIDER_NAME = "Unknown Provider"
+
+# Candidate start of a message in raw file bytes. Only matches at the
+# start of a line count; the caller checks the bytes before the match
+# (a plain literal search is much faster than a lookbehind pattern).
+MESSAGE_START_PATTERN = re.compile(rb"MSH\|")
+
+# Byte values of the segment separators "\n" and "\r"
+LINE_BREAK_BYTES = (10, 13)
+
+# Bytes allowed between a line break and "MSH|": blanks and the MLLP
+# start/end block characters (\x0b before a message, \x1c after it), as
+# in captures from an interface engine. All of them strip like whitespace.
+LEADING_BYTES = b" \t\x0b\x0c\x1c\x1d\x1e\x1f"
+
+# Number of bytes read from disk at a time by the streaming reader
+READ_CHUNK_SIZE = 1 << 16
+
+# Files with fewer messages are parsed in-process even when workers are
+# requested, since starting worker processes would cost more than it saves
+PARALLEL_MIN_MESSAGES = 1000
+
+# Number of messages sent to a worker process at a time
+PARALLEL_CHUNK_SIZE = 256
 
 
 def validate_message_type(msh_data: dict) -> None:
@@ -65,19 +103,46 @@ def validate_message_type(msh_data: dict) -> None:
     """
     message_type = msh_data.get("message_type", "")
 
+    # Messages with custom delimiters write the type as e.g. "SIU$S12"
+    component_separator = msh_data.get("encoding_characters", "^")[:1] or "^"
+    comparable_type = message_type
+    if component_separator != "^":
+        comparable_type = message_type.replace(component_separator, "^")
+
     # Handle different formats of message type
-    # Could be "SIU^S12", "SIU^S12^SIU_S12", or variations
-    type_parts = message_type.split("^")
+    # Could be "SIU^S12", "SIU^S12^SIU_S12", or variations in letter case,
+    # so a case-insensitive prefix check covers all of them
+    if not comparable_type.casefold().startswith(SUPPORTED_MESSAGE_TYPE_PREFIX):
+        raise InvalidMessageTypeError(SUPPORTED_MESSAGE_TYPE, message_type)
 
-    if len(type_parts) >= 2:
-        msg_type = type_parts[0].upper()
-        trigger_event = type_parts[1].upper()
-        full_type = f"{msg_type}^{trigger_event}"
-    else:
-        full_type = message_type.upper()
 
-    if not full_type.startswith("SIU^S12"):
-        raise InvalidMessageTypeError(SUPPORTED_MESSAGE_TYPE, message_type)
+def read_message_delimiters(message: str) -> Tuple[str, str]:
+    """
+    Read the field and component separators a message declares in MSH.
+
+    Almost every sender uses the standard "|^~\\&" delimiters, so those
+    messages are answered with a single prefix check.
+
+    Args:
+        message: Raw HL7 message string
+
+    Returns:
+        Tuple of (field_separator, component_separator), the standard
+        ("|", "^") when the message doesn't start with an MSH segment
+
+    Example:
+        read_message_delimiters("MSH#$~\\&#APP")  # Returns ("#", "$")
+    """
+    if message.startswith(STANDARD_MSH_HEADER):
+        return "|", "^"
+
+    # Leading blanks or MLLP framing may come before the MSH segment
+    delimiters = read_msh_delimiters(message.lstrip())
+    if delimiters is None:
+        return "|", "^"
+
+    field_separator, encoding_characters, _ = delimiters
+    return field_separator, encoding_characters[:1] or "^"
 
 
 def parse_single_message(message: str) -> Appointment:
@@ -101,49 +166,55 @@ def parse_single_message(message: str) -> Appointment:
         InvalidMessageTypeError: If message is not SIU^S12
         MissingSegmentError: If required segments are missing
     """
-    # Split message into segments
-    segments = split_message_into_segments(message)
-
-    if not segments:
+    # Whitespace-only messages have no segments at all
+    if not message or message.isspace():
         raise InvalidHL7FormatError("Message is empty or contains no segments")
 
+    # Custom delimiters are passed to every split instead of rewriting the
+    # message, so a literal "|" or "^" inside a field value stays intact
+    field_separator, component_separator = read_message_delimiters(message)
+
+    # Split and index segments by name in one pass, so each lookup below
+    # is a dict hit instead of a scan
+    segment_index = split_message_into_indexed_segments(message, field_separator)
+
     # ----- Parse MSH Segment -----
-    msh_segment = get_segment(segments, "MSH")
+    msh_segment = get_segment(segment_index, MSH)
     if not msh_segment:
-        raise MissingSegmentError("MSH")
+        raise MissingSegmentError(MSH)
 
-    msh_data = parse_msh_segment(msh_segment)
+    msh_data = parse_msh_segment(msh_segment, field_separator, component_separator)
 
     # Validate message type
     validate_message_type(msh_data)
 
     # ----- Parse SCH Segment (Required for appointment info) -----
-    sch_segment = get_segment(segments, "SCH")
+    sch_segment = get_segment(segment_index, SCH)
 
     # SCH is required for appointment data
     if not sch_segment:
-        raise MissingSegmentError("SCH")
+        raise MissingSegmentError(SCH)
 
-    sch_data = parse_sch_segment(sch_segment)
+    sch_data = parse_sch_segment(sch_segment, field_separator, component_separator)
 
     # Validate that minimum required appointment data is present
     if not sch_data.get("appointment_id"):
-        raise MalformedSegmentError("SCH", "Missing appointment ID")
+        raise MalformedSegmentError(SCH, "Missing appointment ID")
 
     if not sch_data.get("appointment_datetime"):
-        raise MalformedSegmentError("SCH", "Missing or invalid appointment datetime")
+        raise MalformedSegmentError(SCH, "Missing or invalid appointment datetime")
 
     # ----- Parse PID Segment -----
-    pid_segment = get_segment(segments, "PID")
+    pid_segment = get_segment(segment_index, PID)
     patient = None
 
     if pid_segment:
-        pid_data = parse_pid_segment(pid_segment)
+        pid_data = parse_pid_segment(pid_segment, field_separator, component_separator)
 
         # Only create Patient if at least an ID or name is present
         if pid_data.get("patient_id") or pid_data.get("last_name"):
             patient = Patient(
-                id=pid_data.get("patient_id", "UNKNOWN"),
+                id=pid_data.get("patient_id", UNKNOWN_ID),
                 first_name=pid_data.get("first_name", ""),
                 last_name=pid_data.get("last_name", ""),
                 dob=pid_data.get("dob"),
@@ -151,18 +222,18 @@ def parse_single_message(message: str) -> Appointment:
             )
 
     # ----- Parse PV1 Segment (Optional) -----
-    pv1_segment = get_segment(segments, "PV1")
+    pv1_segment = get_segment(segment_index, PV1)
     provider = None
     pv1_location = None
 
     if pv1_segment:
-        pv1_data = parse_pv1_segment(pv1_segment)
+        pv1_data = parse_pv1_segment(pv1_segment, field_separator, component_separator)
 
         # Extract provider if ID or name is present
         if pv1_data.get("provider_id") or pv1_data.get("provider_name"):
             provider = Provider(
-                id=pv1_data.get("provider_id", "UNKNOWN"),
-                name=pv1_data.get("provider_name", "Unknown Provider"),
+                id=pv1_data.get("provider_id", UNKNOWN_ID),
+                name=pv1_data.get("provider_name", UNKNOWN_PROVIDER_NAME),
             )
 
         # Save location from PV1 as backup
@@ -184,56 +255,31 @@ def parse_single_message(message: str) -> Appointment:
     return appointment
 
 
-def split_hl7_file_into_messages(content: str) -> List[str]:
+def split_hl7_file_into_messages(content: str) -> Iterator[str]:
     """
     Split file content into individual HL7 messages.
 
-    Multiple HL7 messages in a file are typically separated by:
-    - Blank lines
-    - Each message starts with "MSH|"
+    The content is framed exactly like the file readers frame raw bytes
+    (see find_message_starts): a message starts at every line beginning
+    with "MSH|", after optional blanks or MLLP framing bytes. Blank lines
+    between messages are dropped along with the surrounding whitespace
+    and framing. Line endings inside a message are kept as they are.
+
+    Messages are yielded one at a time, so no list of all messages is
+    built up front.
 
     Args:
         content: Raw file content
 
-    Returns:
-        List of individual message strings
+    Yields:
+        Individual message strings
     """
-    messages = []
-    current_message_lines = []
-
-    # Normalize line endings
-    normalized = content.replace("\r\n", "\n").replace("\r", "\n")
-    lines = normalized.split("\n")
-
-    for line in lines:
-        stripped_line = line.strip()
-
-        # Skip empty lines between messages
-        if not stripped_line:
-            # If lines have been accumulated, this might be end of a message
-            if current_message_lines:
-                message = "\n".join(current_message_lines)
-                messages.append(message)
-                current_message_lines = []
-            continue
-
-        # If line starts with MSH, it's a new message
-        if stripped_line.startswith("MSH|"):
-            # Save previous message if exists
-            if current_message_lines:
-                message = "\n".join(current_message_lines)
-                messages.append(message)
-                current_message_lines = []
-
-        # Add line to current message
-        current_message_lines.append(stripped_line)
+    buffer = content.encode("utf-8")
+    boundaries = find_message_starts(buffer)
+    boundaries.append(len(buffer))
 
-    # Last message
-    if current_message_lines:
-        message = "\n".join(current_message_lines)
-        messages.append(message)
-
-    return messages
+    for message in iter_message_slices(buffer, boundaries):
+        yield message.strip()
 
 
 def parse_hl7_message(message: str) -> Appointment:
@@ -264,27 +310,32 @@ def parse_hl7_message(message: str) -> Appointment:
         '''
         appointment = parse_hl7_message(message)
     """
-    if not message or not message.strip():
+    # Strip once; parse_single_message works on the message as given
+    message = message.strip() if message else ""
+    if not message:
         raise InvalidHL7FormatError("Message is empty")
 
-    return parse_single_message(message.strip())
+    return parse_single_message(message)
 
 
-def parse_hl7_file(file_path: str) -> List[Appointment]:
+def parse_hl7_file(file_path: str, workers: Optional[int] = None) -> List[Appointment]:
     """
     Parse an HL7 file containing one or more SIU S12 messages.
 
     This function:
-    1. Reads the file from disk
-    2. Splits it into individual messages
-    3. Parses each message
-    4. Returns list of Appointment objects
+    1. Streams the file message by message
+    2. Parses each message
+    3. Returns list of Appointment objects
 
     Args:
         file_path: Path to the .hl7 file
+        workers: Number of worker processes for large files. Messages are
+            independent, so files with at least PARALLEL_MIN_MESSAGES
+            messages are parsed in parallel when this is set. Smaller
+            files are always parsed in-process.
 
     Returns:
-        List of Appointment objects (one per valid message)
+        List of Appointment objects (one per valid message), in file order
 
     Raises:
         FileNotFoundError: If file doesn't exist
@@ -296,33 +347,59 @@ def parse_hl7_file(file_path: str) -> List[Appointment]:
         for appt in appointments:
             print(appt.to_json())
     """
-    # Read file content
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    # Parse every message, recording errors but continuing with other messages
+    errors = []
+    appointments = _parse_file_messages(file_path, workers, errors)
 
-    if not content.strip():
+    # Nothing parsed and nothing failed means the file had no messages at all
+    if not appointments and not errors:
         raise InvalidHL7FormatError("File is empty")
 
-    # Split into individual messages
-    raw_messages = split_hl7_file_into_messages(content)
+    # If no messages were parsed successfully, raise error
+    if not appointments:
+        raise InvalidHL7FormatError(
+            f"No valid SIU^S12 messages found. Errors: {'; '.join(errors)}"
+        )
 
-    if not raw_messages:
-        raise InvalidHL7FormatError("No HL7 messages found in file")
+    return appointments
+
+
+def parse_hl7_bytes(data: bytes) -> List[Appointment]:
+    """
+    Parse raw HL7 bytes containing one or more SIU S12 messages.
+
+    Useful when messages come from a socket, a queue or object storage
+    rather than a file on disk. Message boundaries are found on the raw
+    bytes, and each message is decoded only when it is parsed, so the
+    whole input is never converted into one big string.
+
+    Args:
+        data: Raw UTF-8 encoded HL7 content
+
+    Returns:
+        List of Appointment objects (one per valid message)
+
+    Raises:
+        InvalidHL7FormatError: If data contains no valid messages
+
+    Example:
+        appointments = parse_hl7_bytes(socket_payload)
+    """
+    boundaries = find_message_starts(data)
+    boundaries.append(len(data))
 
-    # Parse each message
-    appointments = []
     errors = []
+    appointments = []
 
-    for i, raw_message in enumerate(raw_messages, start=1):
-        try:
-            appointment = parse_single_message(raw_message)
+    for i, message in enumerate(iter_message_slices(data, boundaries), start=1):
+        appointment = _parse_or_record(message, i, True, errors)
+        if appointment is not None:
             appointments.append(appointment)
-        except HL7ParserError as e:
-            # Record error but continue parsing other messages
-            errors.append(f"Message {i}: {str(e)}")
 
-    # If no messages were parsed successfully, raise error
-    if not appointments and errors:
+    if not appointments and not errors:
+        raise InvalidHL7FormatError("Data is empty")
+
+    if not appointments:
         raise InvalidHL7FormatError(
             f"No valid SIU^S12 messages found. Errors: {'; '.join(errors)}"
         )
@@ -330,7 +407,7 @@ def parse_hl7_file(file_path: str) -> List[Appointment]:
     return appointments
 
 
-def parse_hl7_file_with_errors(file_path: str) -> tuple:
+def parse_hl7_file_with_errors(file_path: str, workers: Optional[int] = None) -> tuple:
     """
     Parse an HL7 file and return both successes and errors.
 
@@ -340,6 +417,8 @@ def parse_hl7_file_with_errors(file_path: str) -> tuple:
 
     Args:
         file_path: Path to the .hl7 file
+        workers: Number of worker processes for large files (see
+            parse_hl7_file)
 
     Returns:
         Tuple of (appointments, errors) where:
@@ -352,46 +431,35 @@ def parse_hl7_file_with_errors(file_path: str) -> tuple:
         if errors:
             print(f"Encountered {len(errors)} errors")
     """
-    # Read file content
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    if not content.strip():
-        return [], ["File is empty"]
-
-    # Split into individual messages
-    raw_messages = split_hl7_file_into_messages(content)
-
-    if not raw_messages:
-        return [], ["No HL7 messages found in file"]
-
-    # Parse each message
-    appointments = []
     errors = []
+    appointments = _parse_file_messages(file_path, workers, errors)
 
-    for i, raw_message in enumerate(raw_messages, start=1):
-        try:
-            appointment = parse_single_message(raw_message)
-            appointments.append(appointment)
-        except HL7ParserError as e:
-            errors.append(f"Message {i}: {str(e)}")
+    if not appointments and not errors:
+        return [], ["File is empty"]
 
     return appointments, errors
 
 
 def parse_hl7_file_streaming(
-    file_path: str, continue_on_error: bool = False
+    file_path: str,
+    continue_on_error: bool = False,
+    errors: Optional[List[str]] = None,
 ) -> Iterator[Appointment]:
     """
     Parse an HL7 file using streaming (memory-efficient for large files).
 
-    This function reads the file line by line and processes messages as they
-    are encountered, rather than loading the entire file into memory first.
-    This is more memory-efficient for large HL7 files.
+    This function reads the file in large binary chunks and processes every
+    complete message in a chunk as soon as it arrives, rather than loading
+    the entire file into memory first. A message is complete once the next
+    "MSH|" segment (or the end of the file) is seen. This is more
+    memory-efficient for large HL7 files.
 
     Args:
         file_path: Path to the .hl7 file
         continue_on_error: If True, continue parsing other messages when one fails
+        errors: Optional list that receives an error message for every
+            message that fails to parse. When given, failed messages are
+            always skipped, regardless of continue_on_error.
 
     Yields:
         Appointment objects as they are parsed
@@ -404,57 +472,326 @@ def parse_hl7_file_streaming(
         for appointment in parse_hl7_file_streaming("large_file.hl7"):
             print(appointment.to_json())
     """
-    current_message_lines = []
-    message_count = 0
-
-    with open(file_path, "r", encoding="utf-8") as f:
-        for line in f:
-            # Normalize line endings
-            line = line.rstrip("\r\n")
-
-            # Check if this is the start of a new message
-            if line.startswith("MSH|") and current_message_lines:
-                # Process the previous complete message
-                message_count += 1
-                message = "\n".join(current_message_lines)
-                try:
-                    appointment = parse_single_message(message)
-                    yield appointment
-                except HL7ParserError as e:
-                    if not continue_on_error:
-                        raise HL7ParserError(
-                            f"Message {message_count}: {str(e)}"
-                        ) from e
-                    # If continue_on_error, skip this message
-
-                # Reset for next message
-                current_message_lines = []
-
-            # Add non-empty lines to current message
-            if line.strip():
-                current_message_lines.append(line)
-
-        # Process the last message if any
-        if current_message_lines:
-            message_count += 1
-            message = "\n".join(current_message_lines)
-            try:
-                appointment = parse_single_message(message)
-                yield appointment
-            except HL7ParserError as e:
-                if not continue_on_error:
-                    raise HL7ParserError(f"Message {message_count}: {str(e)}") from e
-
-
-def appointments_to_json(appointments: List[Appointment], indent: int = 2) -> str:
+    with open(file_path, "rb") as f:
+        yield from _parse_hl7_stream(f, continue_on_error, errors)
+
+
+def _parse_hl7_stream(
+    stream: IO,
+    continue_on_error: bool = False,
+    errors: Optional[List[str]] = None,
+) -> Iterator[Appointment]:
+    """
+    Parse the messages of an open stream, one at a time.
+
+    Same behavior as parse_hl7_file_streaming, for a file-like object
+    instead of a path (binary or text, e.g. io.StringIO).
+
+    Args:
+        stream: File-like object with a read(size) method
+        continue_on_error: If True, continue parsing other messages when one fails
+        errors: Optional list that receives an error message for every
+            message that fails to parse
+
+    Yields:
+        Appointment objects as they are parsed
+    """
+    for message_number, message in enumerate(_iter_frames(stream), start=1):
+        appointment = _parse_or_record(
+            message, message_number, continue_on_error, errors
+        )
+        if appointment is not None:
+            yield appointment
+
+
+def iter_file_messages(file_path: str) -> Iterator[str]:
+    """
+    Read the raw messages of an HL7 file one at a time.
+
+    Args:
+        file_path: Path to the .hl7 file
+
+    Yields:
+        Raw message strings, in file order
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    with open(file_path, "rb") as f:
+        yield from _iter_frames(f)
+
+
+def _iter_frames(stream: IO) -> Iterator[str]:
+    """
+    Frame the messages of a stream (file, pipe, socket file, ...).
+
+    The stream is read in large chunks. Every message that is complete
+    once a chunk arrives is yielded right away, and only the unfinished
+    tail is kept for the next chunk. A message is complete once the next
+    "MSH|" line (or the end of the stream) is seen.
+
+    Args:
+        stream: Binary or text file-like object with a read(size) method
+
+    Yields:
+        Raw message strings, in stream order
+    """
+    buffer = bytearray()
+
+    while True:
+        chunk = stream.read(READ_CHUNK_SIZE)
+        if isinstance(chunk, str):
+            # Text streams are framed the same way, as UTF-8 bytes
+            chunk = chunk.encode("utf-8")
+
+        if chunk:
+            # Only the new bytes (plus a few for a split "MSH|") need a scan
+            scan_from = max(1, len(buffer) - 3)
+            buffer += chunk
+            boundaries = find_message_starts(buffer, scan_from)
+        else:
+            # End of stream: whatever is left is the last message
+            boundaries = [len(buffer)]
+
+        yield from iter_message_slices(buffer, boundaries)
+
+        # Keep the incomplete last message for the next chunk
+        if boundaries:
+            del buffer[: boundaries[-1]]
+
+        if not chunk:
+            break
+
+
+def find_message_starts(buffer: bytes, scan_from: int = 1) -> List[int]:
+    """
+    Find where messages start in raw HL7 bytes.
+
+    A message starts wherever a line begins with "MSH|", optionally after
+    blanks or MLLP framing bytes. Only matches at or after scan_from are
+    returned; scan_from must be at least 1, since the very start of the
+    buffer is always treated as a message start.
+
+    Args:
+        buffer: Raw HL7 bytes (bytes, bytearray or any buffer)
+        scan_from: Index to start searching from
+
+    Returns:
+        Sorted list of start positions
+
+    Example:
+        find_message_starts(b"MSH|1\nSCH|1\nMSH|2")  # Returns [12]
+    """
+    return [
+        match.start()
+        for match in MESSAGE_START_PATTERN.finditer(buffer, scan_from)
+        if buffer[match.start() - 1] in LINE_BREAK_BYTES
+        or _starts_line(buffer, match.start())
+    ]
+
+
+def _starts_line(buffer: bytes, position: int) -> bool:
+    """
+    Check whether only LEADING_BYTES precede position on its line.
+
+    Args:
+        buffer: Raw HL7 bytes
+        position: Index of a candidate "MSH|"
+
+    Returns:
+        True if a line break (or the start of the buffer) comes first
+    """
+    position -= 1
+    while position >= 0:
+        byte = buffer[position]
+        if byte in LINE_BREAK_BYTES:
+            return True
+        if byte not in LEADING_BYTES:
+            return False
+        position -= 1
+    return True
+
+
+def iter_message_slices(buffer: bytes, boundaries: List[int]) -> Iterator[str]:
+    """
+    Decode the messages that end at the given boundaries.
+
+    The first message starts at index 0 and every boundary ends the
+    message before it. Blank space between messages is skipped.
+
+    Args:
+        buffer: Raw HL7 bytes
+        boundaries: Sorted end positions, e.g. from find_message_starts
+
+    Yields:
+        Decoded message strings
+    """
+    message_start = 0
+    for message_end in boundaries:
+        message = buffer[message_start:message_end].decode("utf-8")
+        message_start = message_end
+
+        # Same test as message.strip() without copying the message
+        if message and not message.isspace():
+            yield message
+
+
+def _parse_file_messages(
+    file_path: str, workers: Optional[int], errors: List[str]
+) -> List[Appointment]:
+    """
+    Parse every message of a file, in parallel for large files.
+
+    Args:
+        file_path: Path to the .hl7 file
+        workers: Number of worker processes, or None to parse in-process
+        errors: List that receives an error message per failed message
+
+    Returns:
+        List of successfully parsed Appointment objects, in file order
+    """
+    if not workers:
+        return list(parse_hl7_file_streaming(file_path, errors=errors))
+
+    messages = list(iter_file_messages(file_path))
+
+    if len(messages) < PARALLEL_MIN_MESSAGES:
+        results = map(_safe_parse, messages)
+    else:
+        # chunksize batches many messages per round trip to a worker
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(_safe_parse, messages, chunksize=PARALLEL_CHUNK_SIZE)
+            )
+
+    appointments = []
+    for message_number, (appointment, error) in enumerate(results, start=1):
+        if error is not None:
+            errors.append(f"Message {message_number}: {error}")
+        else:
+            appointments.append(appointment)
+
+    return appointments
+
+
+def _safe_parse(message: str) -> Tuple[Optional[Appointment], Optional[str]]:
+    """
+    Parse one message, returning the error text instead of raising.
+
+    Runs inside worker processes, so it returns a plain string for errors
+    to keep what is sent back between processes small and picklable.
+
+    Args:
+        message: Raw HL7 message string
+
+    Returns:
+        Tuple of (appointment, None) on success or (None, error) on failure
+    """
+    try:
+        return parse_single_message(message), None
+    except HL7ParserError as e:
+        return None, str(e)
+
+
+def _parse_or_record(
+    message: str,
+    message_number: int,
+    continue_on_error: bool,
+    errors: Optional[List[str]],
+) -> Optional[Appointment]:
+    """
+    Parse one message from a file, handling failures for the file readers.
+
+    Args:
+        message: Raw HL7 message string
+        message_number: 1-based position of the message in the file
+        continue_on_error: If True, failed messages are skipped
+        errors: Optional list that receives an error message per failure
+
+    Returns:
+        Appointment object, or None if the message was skipped
+
+    Raises:
+        HL7ParserError: If parsing fails and failures aren't skipped
+    """
+    try:
+        return parse_single_message(message)
+    except HL7ParserError as e:
+        if errors is not None:
+            errors.append(f"Message {message_number}: {str(e)}")
+        elif not continue_on_error:
+            raise HL7ParserError(f"Message {message_number}: {str(e)}") from e
+        return None
+
+
+def appointments_to_json(
+    appointments: List[Appointment], indent: Optional[int] = 2
+) -> str:
     """
     Convert a list of appointments to JSON string.
 
+    Passing indent=None produces compact single-line output, which also
+    lets the json module use its C-accelerated encoder (the pure-Python
+    encoder is used whenever an indent is set).
+
     Args:
         appointments: List of Appointment objects
-        indent: JSON indentation level (default 2)
+        indent: JSON indentation level (default 2), or None for compact output
 
     Returns:
         JSON string representation
     """
-    return json.dumps([appt.to_dict() for appt in appointments], indent=indent)
+    # Appointments never reference each other, so the circular-reference
+    # bookkeeping the encoder does for every dict can be skipped
+    return json.dumps(
+        appointments, default=json_default, indent=indent, check_circular=False
+    )
+
+
+def appointments_to_json_stream(
+    appointments: Iterable[Appointment], stream: TextIO, indent: Optional[int] = 2
+) -> int:
+    """
+    Write appointments to a text stream as one JSON array, one at a time.
+
+    The output is exactly what appointments_to_json() returns, but only a
+    single appointment is encoded in memory at any moment instead of the
+    whole document. Works with any iterable, including the generator from
+    parse_hl7_file_streaming().
+
+    Args:
+        appointments: Appointment objects to write
+        stream: Text stream to write to (open file, sys.stdout, ...)
+        indent: JSON indentation level (default 2), or None for compact output
+
+    Returns:
+        Number of appointments written
+    """
+    if indent is None:
+        separator = ", "
+        item_prefix = ""
+        closing = "]"
+    else:
+        # Items sit one level deep inside the array. JSON strings can't
+        # contain a raw newline, so every newline in an encoded item is
+        # a line break that needs the extra indentation.
+        item_prefix = "\n" + " " * indent
+        separator = ","
+        closing = "\n]"
+
+    # One encoder for all items; json.dumps would build a new one per call
+    encode = json.JSONEncoder(
+        default=json_default, indent=indent, check_circular=False
+    ).encode
+
+    count = 0
+    for appointment in appointments:
+        item = encode(appointment)
+        if item_prefix:
+            item = item_prefix + item.replace("\n", item_prefix)
+        stream.write(separator + item if count else "[" + item)
+        count += 1
+
+    # An empty array has no line breaks, with or without indent
+    stream.write(closing if count else "[]")
+    return count
@@ -15,11 +15,39 @@ Note: HL7 "standards" are more like guidelines.
 Different EMR systems have quirks, so defensive parsing is essential.
 """
 
-from typing import Optional, List
-from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Optional, List, Union
 
 from .exceptions import MalformedSegmentError
 
+# Digits in a full HL7 timestamp (YYYYMMDDHHMMSS)
+TIMESTAMP_DIGITS = 14
+
+# Number of distinct timestamps/dates remembered by their parsers. A
+# clinic's schedule repeats the same slots and birth dates over and over,
+# and a cache hit is an order of magnitude cheaper than parsing again.
+PARSE_CACHE_SIZE = 2048
+
+# Maximum number of distinct values remembered by share_value
+SHARED_VALUES_LIMIT = 4096
+_shared_values: Dict[str, str] = {}
+
+# Days in each month of a non-leap year
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Segment name plus field separator that each segment parser expects.
+# Compared against segment[:4], a bit cheaper than a startswith() call.
+MSH_TAG = "MSH|"
+SCH_TAG = "SCH|"
+PID_TAG = "PID|"
+PV1_TAG = "PV1|"
+
+# Shared get_segment default, so a missing segment doesn't build a new list
+NO_SEGMENT = (None,)
+
+# Start of an MSH segment that uses the standard delimiters
+STANDARD_MSH_HEADER = "MSH|^~\\&"
+
 
 def safe_get_field(fields: List[str], index: int, default: str = "") -> str:
     """
@@ -70,12 +98,80 @@ def safe_get_component(field: str, index: int, component_separator: str = "^") -
     if not field:
         return ""
 
+    # The first two components are the ones parsers ask for; partition
+    # stops at the separator instead of splitting the whole field
+    if index == 0:
+        return field.partition(component_separator)[0].strip()
+    if index == 1:
+        _, found, rest = field.partition(component_separator)
+        return rest.partition(component_separator)[0].strip() if found else ""
+
     components = field.split(component_separator)
     if index < len(components):
         return components[index].strip()
     return ""
 
 
+def share_value(value: str) -> str:
+    """
+    Return a shared copy of a value that repeats across many messages.
+
+    Reasons, locations and providers come from a small set in practice,
+    but every parsed message holds its own copy of the string. Returning
+    the first copy seen for each value lets all appointments share it.
+    The table is emptied once it reaches SHARED_VALUES_LIMIT entries, so
+    files with mostly unique values can't grow it without bound.
+
+    Args:
+        value: Field value to share
+
+    Returns:
+        An equal string, shared with earlier calls where possible
+
+    Example:
+        share_value("Clinic A") is share_value("Clinic " + "A")  # True
+    """
+    shared = _shared_values.get(value)
+    if shared is None:
+        if len(_shared_values) >= SHARED_VALUES_LIMIT:
+            _shared_values.clear()
+        _shared_values[value] = shared = value
+    return shared
+
+
+def is_valid_date(year: int, month: int, day: int) -> bool:
+    """
+    Check that a year, month and day form a real calendar date.
+
+    Same rules as datetime.date (years 1-9999, leap years included)
+    without building a date object just to throw it away.
+
+    Args:
+        year: Four-digit year
+        month: Month number (1-12)
+        day: Day of the month
+
+    Returns:
+        True if the date exists
+
+    Example:
+        is_valid_date(2024, 2, 29)  # Returns True
+        is_valid_date(2025, 2, 29)  # Returns False
+    """
+    if not (1 <= year <= 9999 and 1 <= month <= 12 and day >= 1):
+        return False
+    if day <= DAYS_IN_MONTH[month - 1]:
+        return True
+    # Only February 29th is left, and only in leap years
+    return (
+        month == 2
+        and day == 29
+        and year % 4 == 0
+        and (year % 100 != 0 or year % 400 == 0)
+    )
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_hl7_timestamp(timestamp: str) -> Optional[str]:
     """
     Convert HL7 timestamp to ISO 8601 format.
@@ -99,48 +195,84 @@ def parse_hl7_timestamp(timestamp: str) -> Optional[str]:
     if not timestamp:
         return None
 
-    # Remove any timezone info for simplicity (e.g., +0000 or -0500)
-    # Keep only the numeric part
-    clean_timestamp = ""
-    for char in timestamp:
-        if char.isdigit():
-            clean_timestamp += char
-        elif char in ["+", "-"] and len(clean_timestamp) >= 8:
-            # Timezone indicator - stop here
-            break
+    # Fast path: HL7 timestamps are positional, so when the first 14
+    # characters are plain digits they are exactly the digits we need
+    # (anything after them, like a timezone, is ignored anyway)
+    clean_timestamp = timestamp[:TIMESTAMP_DIGITS]
+    fast_path = clean_timestamp.isascii() and clean_timestamp.isdigit()
+    if not fast_path:
+        clean_timestamp = _extract_timestamp_digits(timestamp)
 
     if len(clean_timestamp) < 8:
         return None  # Not enough digits for a valid date
 
-    try:
-        # Parse based on length of timestamp
-        year = clean_timestamp[0:4]
-        month = clean_timestamp[4:6]
-        day = clean_timestamp[6:8]
-
-        # Default time values
-        hour = "00"
-        minute = "00"
-        second = "00"
-
-        # Extract time if present
-        if len(clean_timestamp) >= 10:
-            hour = clean_timestamp[8:10]
-        if len(clean_timestamp) >= 12:
-            minute = clean_timestamp[10:12]
-        if len(clean_timestamp) >= 14:
-            second = clean_timestamp[12:14]
+    # Parse based on length of timestamp
+    year = clean_timestamp[0:4]
+    month = clean_timestamp[4:6]
+    day = clean_timestamp[6:8]
+
+    # Default time values
+    hour = "00"
+    minute = "00"
+    second = "00"
+
+    # Extract time if present
+    if len(clean_timestamp) >= 10:
+        hour = clean_timestamp[8:10]
+    if len(clean_timestamp) >= 12:
+        minute = clean_timestamp[10:12]
+    if len(clean_timestamp) >= 14:
+        second = clean_timestamp[12:14]
+
+    # Plain string comparisons cover every valid value except days 29-31
+    # and year 0000, so only those (and non-ASCII digits picked up by the
+    # slow path) need the full numeric check
+    if not (
+        fast_path
+        and "01" <= month <= "12"
+        and "01" <= day <= "28"
+        and hour <= "23"
+        and minute <= "59"
+        and second <= "59"
+        and year != "0000"
+    ):
+        try:
+            valid = is_valid_date(int(year), int(month), int(day)) and (
+                int(hour) < 24 and int(minute) < 60 and int(second) < 60
+            )
+        except ValueError:
+            return None  # Digit characters int() can't read, like "²"
+        if not valid:
+            return None
+
+    # Return ISO 8601 format
+    return f"{year}-{month}-{day}T{hour}:{minute}:{second}Z"
+
+
+def _extract_timestamp_digits(timestamp: str) -> str:
+    """
+    Collect the digits of a timestamp that isn't plain YYYYMMDDHHMMSS.
 
-        # Validate by creating a datetime object
-        datetime(int(year), int(month), int(day), int(hour), int(minute), int(second))
+    Separators are skipped, and a timezone sign (+ or -) ends the
+    timestamp once at least the date has been read.
 
-        # Return ISO 8601 format
-        return f"{year}-{month}-{day}T{hour}:{minute}:{second}Z"
+    Args:
+        timestamp: HL7 formatted timestamp string
 
-    except (ValueError, IndexError):
-        return None
+    Returns:
+        The timestamp digits, e.g. "202505021300" for "202505021300-0500"
+    """
+    clean_timestamp = ""
+    for char in timestamp:
+        if char.isdigit():
+            clean_timestamp += char
+        elif char in ["+", "-"] and len(clean_timestamp) >= 8:
+            # Timezone indicator - stop here
+            break
+    return clean_timestamp
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_hl7_date(date_str: str) -> Optional[str]:
     """
     Convert HL7 date to YYYY-MM-DD format.
@@ -159,27 +291,36 @@ def parse_hl7_date(date_str: str) -> Optional[str]:
     if not date_str:
         return None
 
-    # Extract only digits
-    clean_date = "".join(char for char in date_str if char.isdigit())
+    # Fast path: a plain YYYYMMDD prefix needs no digit filtering
+    clean_date = date_str[:8]
+    fast_path = clean_date.isascii() and clean_date.isdigit()
+    if not fast_path:
+        # Extract only digits
+        clean_date = "".join(char for char in date_str if char.isdigit())
 
     if len(clean_date) < 8:
         return None
 
-    try:
-        year = clean_date[0:4]
-        month = clean_date[4:6]
-        day = clean_date[6:8]
+    year = clean_date[0:4]
+    month = clean_date[4:6]
+    day = clean_date[6:8]
 
-        # Validate the date
-        datetime(int(year), int(month), int(day))
+    # Validate the date (numerically only when string checks can't tell)
+    if not (
+        fast_path and "01" <= month <= "12" and "01" <= day <= "28" and year != "0000"
+    ):
+        try:
+            if not is_valid_date(int(year), int(month), int(day)):
+                return None
+        except ValueError:
+            return None
 
-        return f"{year}-{month}-{day}"
+    return f"{year}-{month}-{day}"
 
-    except (ValueError, IndexError):
-        return None
 
-
-def parse_msh_segment(segment: str) -> dict:
+def parse_msh_segment(
+    segment: str, field_separator: str = "|", component_separator: str = "^"
+) -> dict:
     """
     Parse MSH (Message Header) segment.
 
@@ -197,6 +338,8 @@ def parse_msh_segment(segment: str) -> dict:
 
     Args:
         segment: The full MSH segment string
+        field_separator: Field separator declared in MSH-1
+        component_separator: Component separator declared in MSH-2
 
     Returns:
         Dictionary with message type and control ID
@@ -209,13 +352,17 @@ def parse_msh_segment(segment: str) -> dict:
         result = parse_msh_segment(segment)
         # result["message_type"] = "SIU^S12"
     """
-    if not segment.startswith("MSH|"):
+    tag = MSH_TAG if field_separator == "|" else "MSH" + field_separator
+    if segment[:4] != tag:
         raise MalformedSegmentError(
-            "MSH", f"Segment must start with 'MSH|', got: {segment[:20]}..."
+            "MSH", f"Segment must start with '{tag}', got: {segment[:20]}..."
         )
 
-    # Split the segment by pipe
-    fields = segment.split("|")
+    # Split the segment by pipe. Only fields up to MSH-10 (index 9) are
+    # read, so the rest of the segment is left unsplit, and short segments
+    # are padded with empty fields so they can be indexed directly.
+    fields = segment.split(field_separator, 10)
+    fields += [""] * (11 - len(fields))
 
     # For MSH, the first | is field 1, so indexing needs adjustment
     # MSH|^~\&|...|message_type|...
@@ -224,19 +371,21 @@ def parse_msh_segment(segment: str) -> dict:
     # So MSH-9 (message type) is at index 8 in zero-based array
 
     result = {
-        "field_separator": "|",
-        "encoding_characters": safe_get_field(fields, 1, "^~\\&"),
-        "sending_application": safe_get_field(fields, 2),
-        "sending_facility": safe_get_field(fields, 3),
-        "message_datetime": safe_get_field(fields, 6),
-        "message_type": safe_get_field(fields, 8),
-        "message_control_id": safe_get_field(fields, 9),
+        "field_separator": field_separator,
+        "encoding_characters": fields[1].strip() or "^~\\&",
+        "sending_application": fields[2].strip(),
+        "sending_facility": fields[3].strip(),
+        "message_datetime": fields[6].strip(),
+        "message_type": fields[8].strip(),
+        "message_control_id": fields[9].strip(),
     }
 
     return result
 
 
-def parse_sch_segment(segment: str) -> dict:
+def parse_sch_segment(
+    segment: str, field_separator: str = "|", component_separator: str = "^"
+) -> dict:
     """
     Parse SCH (Scheduling Activity Information) segment.
 
@@ -253,6 +402,8 @@ def parse_sch_segment(segment: str) -> dict:
 
     Args:
         segment: The full SCH segment string
+        field_separator: Field separator declared in MSH-1
+        component_separator: Component separator declared in MSH-2
 
     Returns:
         Dictionary with appointment details
@@ -263,32 +414,36 @@ def parse_sch_segment(segment: str) -> dict:
     Example:
         segment = "SCH|123456|456789|...|Consultation|...|...|...|20250502130000|..."
     """
-    if not segment.startswith("SCH|"):
+    tag = SCH_TAG if field_separator == "|" else "SCH" + field_separator
+    if segment[:4] != tag:
         raise MalformedSegmentError(
-            "SCH", f"Segment must start with 'SCH|', got: {segment[:20]}..."
+            "SCH", f"Segment must start with '{tag}', got: {segment[:20]}..."
         )
 
-    fields = segment.split("|")
+    # Fields up to SCH-11 are read; pad short segments so they can be
+    # indexed directly and leave anything after SCH-11 unsplit
+    fields = segment.split(field_separator, 12)
+    fields += [""] * (13 - len(fields))
 
     # Get appointment ID - prefer filler ID (SCH-2), fall back to placer (SCH-1)
     # Filler ID is usually more reliable since it's from the actual scheduling system
-    placer_id = safe_get_field(fields, 1)
-    filler_id = safe_get_field(fields, 2)
+    placer_id = fields[1].strip()
+    filler_id = fields[2].strip()
     appointment_id = filler_id if filler_id else placer_id
 
     # If IDs have components (like 12345^SYSTEM^ISO), get just the actual ID
-    if "^" in appointment_id:
-        appointment_id = safe_get_component(appointment_id, 0)
+    if component_separator in appointment_id:
+        appointment_id = appointment_id.partition(component_separator)[0].strip()
 
     # Get appointment reason - can be in SCH-6 or SCH-7 depending on system
     # SCH-6 is "Event Reason", SCH-7 is "Appointment Reason" - try both
-    reason_field = safe_get_field(fields, 6)
-    if not reason_field:
-        reason_field = safe_get_field(fields, 7)
+    reason_field = fields[6].strip() or fields[7].strip()
 
     # Reason might have components like "CODE^Description" - the description is extracted
     reason = (
-        safe_get_component(reason_field, 1) if "^" in reason_field else reason_field
+        reason_field.split(component_separator, 2)[1].strip()
+        if component_separator in reason_field
+        else reason_field
     )
 
     # Get appointment timing (SCH-10 or SCH-11) - contains start/end datetime
@@ -299,7 +454,7 @@ def parse_sch_segment(segment: str) -> dict:
             return ""
         # Timing can be like "20250502130000^20250502140000" (start^end)
         # or just a single datetime, or have other components
-        components = timing_field.split("^")
+        components = timing_field.split(component_separator)
         for component in components:
             component = component.strip()
             # Identify numeric strings with 8+ digits that could represent dates
@@ -308,34 +463,36 @@ def parse_sch_segment(segment: str) -> dict:
         return ""
 
     # Try SCH-10 first
-    start_datetime = get_start_datetime(safe_get_field(fields, 10))
+    start_datetime = get_start_datetime(fields[10].strip())
     if not start_datetime:
         # Fallback to SCH-11
-        start_datetime = get_start_datetime(safe_get_field(fields, 11))
+        start_datetime = get_start_datetime(fields[11].strip())
 
     # If still no datetime found, try the whole field as fallback
     if not start_datetime:
-        timing_field = safe_get_field(fields, 11)
+        timing_field = fields[11].strip()
         if timing_field:
-            start_datetime = timing_field.split("^")[0].strip()
+            start_datetime = timing_field.split(component_separator)[0].strip()
 
     # Get location info (often in SCH-9 or other fields)
-    location = safe_get_field(fields, 9)
-    if "^" in location:
-        location = safe_get_component(location, 0)
+    location = fields[9].strip()
+    if component_separator in location:
+        location = location.partition(component_separator)[0].strip()
 
     result = {
         "appointment_id": appointment_id,
         "appointment_datetime_raw": start_datetime,
         "appointment_datetime": parse_hl7_timestamp(start_datetime),
-        "reason": reason if reason else None,
-        "location": location if location else None,
+        "reason": share_value(reason) if reason else None,
+        "location": share_value(location) if location else None,
     }
 
     return result
 
 
-def parse_pid_segment(segment: str) -> dict:
+def parse_pid_segment(
+    segment: str, field_separator: str = "|", component_separator: str = "^"
+) -> dict:
     """
     Parse PID (Patient Identification) segment.
 
@@ -349,6 +506,8 @@ def parse_pid_segment(segment: str) -> dict:
 
     Args:
         segment: The full PID segment string
+        field_separator: Field separator declared in MSH-1
+        component_separator: Component separator declared in MSH-2
 
     Returns:
         Dictionary with patient information
@@ -359,30 +518,35 @@ def parse_pid_segment(segment: str) -> dict:
     Example:
         segment = "PID|1||P12345||Doe^John^M||19850210|M|..."
     """
-    if not segment.startswith("PID|"):
+    tag = PID_TAG if field_separator == "|" else "PID" + field_separator
+    if segment[:4] != tag:
         raise MalformedSegmentError(
-            "PID", f"Segment must start with 'PID|', got: {segment[:20]}..."
+            "PID", f"Segment must start with '{tag}', got: {segment[:20]}..."
         )
 
-    fields = segment.split("|")
+    # Fields up to PID-8 are read; pad short segments so they can be
+    # indexed directly and leave anything after PID-8 unsplit
+    fields = segment.split(field_separator, 9)
+    fields += [""] * (10 - len(fields))
 
     # PID-3: Patient ID (index 3)
     # Can be complex: ID^check_digit^code_system^...
-    patient_id_field = safe_get_field(fields, 3)
-    patient_id = safe_get_component(patient_id_field, 0) if patient_id_field else ""
+    patient_id_field = fields[3].strip()
+    patient_id = patient_id_field.partition(component_separator)[0].strip()
 
     # PID-5: Patient Name (index 5)
     # Format: LastName^FirstName^MiddleName^Suffix^Prefix
-    name_field = safe_get_field(fields, 5)
-    last_name = safe_get_component(name_field, 0)
-    first_name = safe_get_component(name_field, 1)
+    name_field = fields[5].strip()
+    last_name, _, other_names = name_field.partition(component_separator)
+    last_name = last_name.strip()
+    first_name = other_names.partition(component_separator)[0].strip()
 
     # PID-7: Date of Birth (index 7)
-    dob_raw = safe_get_field(fields, 7)
+    dob_raw = fields[7].strip()
     dob = parse_hl7_date(dob_raw)
 
     # PID-8: Gender (index 8)
-    gender = safe_get_field(fields, 8)
+    gender = fields[8].strip()
     # Normalize gender to single character
     if gender:
         gender = gender[0].upper()
@@ -400,7 +564,9 @@ def parse_pid_segment(segment: str) -> dict:
     return result
 
 
-def parse_pv1_segment(segment: str) -> dict:
+def parse_pv1_segment(
+    segment: str, field_separator: str = "|", component_separator: str = "^"
+) -> dict:
     """
     Parse PV1 (Patient Visit) segment.
 
@@ -417,6 +583,8 @@ def parse_pv1_segment(segment: str) -> dict:
 
     Args:
         segment: The full PV1 segment string
+        field_separator: Field separator declared in MSH-1
+        component_separator: Component separator declared in MSH-2
 
     Returns:
         Dictionary with provider and location information
@@ -427,31 +595,35 @@ def parse_pv1_segment(segment: str) -> dict:
     Example:
         segment = "PV1|1|O|ClinicA^Room203||...|D67890^Smith^Dr||..."
     """
-    if not segment.startswith("PV1|"):
+    tag = PV1_TAG if field_separator == "|" else "PV1" + field_separator
+    if segment[:4] != tag:
         raise MalformedSegmentError(
-            "PV1", f"Segment must start with 'PV1|', got: {segment[:20]}..."
+            "PV1", f"Segment must start with '{tag}', got: {segment[:20]}..."
         )
 
-    fields = segment.split("|")
+    # Fields up to PV1-17 are read; pad short segments so they can be
+    # indexed directly and leave anything after PV1-17 unsplit
+    fields = segment.split(field_separator, 18)
+    fields += [""] * (19 - len(fields))
 
     # PV1-3: Patient Location (index 3)
     # Format can be: Point^Room^Bed^Facility^...
-    location_field = safe_get_field(fields, 3)
+    location_field = fields[3].strip()
     if location_field:
         # Try to build a readable location string
-        location_parts = location_field.split("^")
+        location_parts = location_field.split(component_separator)
         # Filter out empty parts and join with spaces
         location_parts = [p for p in location_parts if p.strip()]
-        location = " ".join(location_parts) if location_parts else None
+        location = share_value(" ".join(location_parts)) if location_parts else None
     else:
         location = None
 
     # PV1-7: Attending Doctor (index 7)
     # Format: ID^LastName^FirstName^MiddleName^...
-    attending_field = safe_get_field(fields, 7)
+    attending_field = fields[7].strip()
 
     # PV1-17: Admitting Doctor (index 17) - fallback
-    admitting_field = safe_get_field(fields, 17)
+    admitting_field = fields[17].strip()
 
     # Use attending doctor if available, otherwise admitting
     provider_field = attending_field if attending_field else admitting_field
@@ -460,9 +632,12 @@ def parse_pv1_segment(segment: str) -> dict:
     provider_name = ""
 
     if provider_field:
-        provider_id = safe_get_component(provider_field, 0)
-        last_name = safe_get_component(provider_field, 1)
-        first_name = safe_get_component(provider_field, 2)
+        # ID^LastName^FirstName are needed, so split once up to there
+        components = provider_field.split(component_separator, 3)
+        components += [""] * (3 - len(components))
+        provider_id = components[0].strip()
+        last_name = components[1].strip()
+        first_name = components[2].strip()
 
         # Build provider name
         if first_name and last_name:
@@ -473,14 +648,46 @@ def parse_pv1_segment(segment: str) -> dict:
             provider_name = first_name
 
     result = {
-        "provider_id": provider_id,
-        "provider_name": provider_name,
+        "provider_id": share_value(provider_id),
+        "provider_name": share_value(provider_name),
         "location": location,
     }
 
     return result
 
 
+def read_msh_delimiters(message: str, position: int = 0) -> Optional[tuple]:
+    """
+    Read the delimiters declared by an MSH segment starting at position.
+
+    Args:
+        message: Raw HL7 message string
+        position: Index where the MSH segment starts
+
+    Returns:
+        Tuple of (field_separator, encoding_characters, end) where end is
+        the index right after MSH-2, or None if there is no MSH segment
+        at that position
+
+    Example:
+        read_msh_delimiters("MSH|^~\\&|APP")  # Returns ("|", "^~\\&", 8)
+    """
+    if not message.startswith("MSH", position):
+        return None
+
+    field_separator = message[position + 3 : position + 4]
+    if not field_separator or field_separator in "\r\n":
+        return None
+
+    # MSH-2 runs up to the next field or segment separator
+    stop_characters = field_separator + "\r\n"
+    end = position + 4
+    while end < len(message) and message[end] not in stop_characters:
+        end += 1
+
+    return field_separator, message[position + 4 : end], end
+
+
 def split_message_into_segments(message: str) -> List[str]:
     """
     Split an HL7 message into individual segments.
@@ -499,39 +706,114 @@ def split_message_into_segments(message: str) -> List[str]:
         segments = split_message_into_segments(message)
         # Returns ["MSH|...", "PID|...", "PV1|..."]
     """
-    # Normalize line endings - replace \r\n with \r, then \n with \r
-    normalized = message.replace("\r\n", "\r").replace("\n", "\r")
-
-    # Split by \r and filter out empty lines
+    # Normalize line endings - replace \r\n with \r, then \n with \r.
+    # Standard HL7 only uses \r, and then there is nothing to replace.
+    normalized = message
+    if "\n" in normalized:
+        normalized = normalized.replace("\r\n", "\r").replace("\n", "\r")
+
+    # Split by \r and filter out empty lines. Plain str.split is about six
+    # times faster here than a precompiled [\r\n]+ regex split.
     segments = [seg.strip() for seg in normalized.split("\r") if seg.strip()]
 
     return segments
 
 
-def get_segment(segments: List[str], segment_name: str) -> Optional[str]:
+def index_segments(
+    segments: List[str], field_separator: str = "|"
+) -> Dict[str, List[str]]:
     """
-    Find a specific segment by its name (first 3 characters).
+    Group segments by name so they can be looked up without a scan.
+
+    Build the index once per message and pass it to get_segment and
+    get_all_segments. Repeating segments keep their message order.
 
     Args:
         segments: List of segment strings
+        field_separator: Field separator declared in MSH-1
+
+    Returns:
+        Dictionary mapping each segment name to its segments
+
+    Example:
+        segments = ["MSH|...", "NTE|1|first", "NTE|2|second"]
+        index_segments(segments)["NTE"]
+        # Returns ["NTE|1|first", "NTE|2|second"]
+    """
+    name_ends = (field_separator, "")
+    segment_index = {}
+    for segment in segments:
+        # Only "XXX|..." or a bare "XXX" is a segment named XXX
+        if segment[3:4] in name_ends:
+            segment_index.setdefault(segment[:3], []).append(segment)
+    return segment_index
+
+
+def split_message_into_indexed_segments(
+    message: str, field_separator: str = "|"
+) -> Dict[str, List[str]]:
+    """
+    Split an HL7 message and group its segments by name in a single pass.
+
+    Same result as index_segments(split_message_into_segments(message)),
+    without building the intermediate segment list.
+
+    Args:
+        message: The raw HL7 message string
+        field_separator: Field separator declared in MSH-1
+
+    Returns:
+        Dictionary mapping each segment name to its segments
+
+    Example:
+        segment_index = split_message_into_indexed_segments("MSH|...\rPID|...")
+        get_segment(segment_index, "PID")  # Returns "PID|..."
+    """
+    normalized = message
+    if "\n" in normalized:
+        normalized = normalized.replace("\r\n", "\r").replace("\n", "\r")
+
+    name_ends = (field_separator, "")
+    segment_index = {}
+    for segment in normalized.split("\r"):
+        segment = segment.strip()
+        # Only "XXX|..." or a bare "XXX" is a segment named XXX
+        if segment and segment[3:4] in name_ends:
+            segment_index.setdefault(segment[:3], []).append(segment)
+    return segment_index
+
+
+def get_segment(
+    segments: Union[List[str], Dict[str, List[str]]], segment_name: str
+) -> Optional[str]:
+    """
+    Find a specific segment by its name (first 3 characters).
+
+    Accepts either a plain list of segments or an index built with
+    index_segments. When looking up several segments of the same message,
+    build the index once and pass it instead of the list, so each lookup
+    is a dictionary access rather than a scan.
+
+    Args:
+        segments: List of segment strings, or segments grouped by name
         segment_name: The segment type to find (e.g., "MSH", "PID")
 
     Returns:
-        The full segment string or None if not found
+        The first segment of that type or None if not found
 
     Example:
         segments = ["MSH|...", "PID|1||P123||Doe^John", "PV1|..."]
         pid_segment = get_segment(segments, "PID")
         # Returns "PID|1||P123||Doe^John"
     """
-    for segment in segments:
-        # Check if segment starts with the segment name followed by |
-        if segment.startswith(segment_name + "|") or segment == segment_name:
-            return segment
-    return None
+    if not isinstance(segments, dict):
+        segments = index_segments(segments)
+    return segments.get(segment_name, NO_SEGMENT)[0]
 
 
-def get_all_segments(segments: List[str], segment_name: str) -> List[str]:
+def get_all_segments(
+    segments: Union[List[str], Dict[str, List[str]]], segment_name: str
+) -> List[str]:
     """
     Find all segments of a specific type.
 
@@ -539,14 +821,12 @@ def get_all_segments(segments: List[str], segment_name: str) -> List[str]:
     returns all instances of a segment type.
 
     Args:
-        segments: List of segment strings
+        segments: List of segment strings, or segments grouped by name
         segment_name: The segment type to find
 
     Returns:
-        List of matching segment strings (may be empty)
+        New list of matching segment strings (may be empty)
     """
-    result = []
-    for segment in segments:
-        if segment.startswith(segment_name + "|") or segment == segment_name:
-            result.append(segment)
-    return result
+    if not isinstance(segments, dict):
+        segments = index_segments(segments)
+    return list(segments.get(segment_name, ()))
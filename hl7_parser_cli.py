@@ -12,8 +12,8 @@ Usage:
 """
 
 import argparse
+import os
 import sys
-import json
 from pathlib import Path
 
 # Add parent directory to path for imports when running as script
@@ -24,9 +24,10 @@ from hl7_parser import (
     parse_hl7_file,
     parse_hl7_file_with_errors,
     parse_hl7_file_streaming,
-    appointments_to_json,
+    appointments_to_json_stream,
     HL7ParserError,
 )
+from hl7_parser.segment_parsers import parse_hl7_timestamp, parse_hl7_date
 
 
 def create_argument_parser() -> argparse.ArgumentParser:
@@ -58,6 +59,9 @@ Examples:
 
   %(prog)s appointments.hl7 -d
       Show errors/warnings and output together
+
+  %(prog)s appointments.hl7 -j 0
+      Parse a large file on all CPU cores
         """,
     )
 
@@ -114,6 +118,15 @@ Examples:
         help="Show both errors/warnings and output data together in a single stream",
     )
 
+    # Optional argument: worker processes
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for files with 1000+ messages (0 = one per CPU, default: 1; ignored with -s)",
+    )
+
     return parser
 
 
@@ -157,6 +170,14 @@ def main() -> int:
         print_error(f"Not a file: {args.input_file}", args.debug, args.verbose)
         return 1
 
+    if args.jobs < 0:
+        print_error("--jobs must be 0 or a positive number", args.debug, args.verbose)
+        return 1
+
+    # 0 means one worker per CPU; a single worker parses in-process
+    workers = args.jobs or os.cpu_count() or 1
+    workers = workers if workers > 1 else None
+
     print_verbose(f"Parsing file: {input_path}", args.verbose, args.debug)
 
     # Parse the HL7 file
@@ -177,7 +198,7 @@ def main() -> int:
                 with open(output_path, "w", encoding="utf-8") as f:
                     count = 0
                     for appointment in appointment_generator:
-                        json_line = json.dumps(appointment.to_dict(), indent=indent)
+                        json_line = appointment.to_json(indent=indent)
                         f.write(json_line + "\n")
                         count += 1
                     print_verbose(
@@ -189,7 +210,7 @@ def main() -> int:
                 # Print to stdout in JSON Lines format
                 count = 0
                 for appointment in appointment_generator:
-                    json_line = json.dumps(appointment.to_dict(), indent=indent)
+                    json_line = appointment.to_json(indent=indent)
                     print(json_line)
                     count += 1
                 print_verbose(
@@ -198,7 +219,9 @@ def main() -> int:
 
         elif args.continue_on_error or args.verbose:
             # Use error-tolerant parsing (when continue_on_error is set or verbose is enabled)
-            appointments, errors = parse_hl7_file_with_errors(str(input_path))
+            appointments, errors = parse_hl7_file_with_errors(
+                str(input_path), workers=workers
+            )
 
             if errors:
                 for error in errors:
@@ -217,7 +240,7 @@ def main() -> int:
             )
         else:
             # Use strict parsing (raises on first error)
-            appointments = parse_hl7_file(str(input_path))
+            appointments = parse_hl7_file(str(input_path), workers=workers)
             print_verbose(
                 f"Parsed {len(appointments)} appointments", args.verbose, args.debug
             )
@@ -236,6 +259,17 @@ def main() -> int:
         print_error(f"Unexpected error: {str(e)}", args.debug, args.verbose)
         return 1
 
+    # Report how often timestamps and dates came from the parse caches.
+    # Messages parsed in worker processes (-j) are not counted here.
+    print_verbose(
+        f"Timestamp cache: {parse_hl7_timestamp.cache_info()}",
+        args.verbose,
+        args.debug,
+    )
+    print_verbose(
+        f"Date cache: {parse_hl7_date.cache_info()}", args.verbose, args.debug
+    )
+
     # Print warnings if debug mode or verbose mode
     if (args.debug or args.verbose) and not args.streaming:
         for i, appointment in enumerate(appointments):
@@ -257,21 +291,14 @@ def main() -> int:
         # Determine JSON formatting
         indent = None if args.compact else 2
 
-        # Convert appointments to JSON
-        json_output = appointments_to_json(appointments, indent=indent if indent else 0)
-
-        if args.compact:
-            # Re-serialize without indentation for compact output
-            data = [appt.to_dict() for appt in appointments]
-            json_output = json.dumps(data)
-
-        # Output JSON
+        # Output JSON, encoding one appointment at a time instead of
+        # building the whole document as a single string first
         if args.output_file:
             # Write to file
             output_path = Path(args.output_file)
             try:
                 with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(json_output)
+                    appointments_to_json_stream(appointments, f, indent=indent)
                 print_verbose(
                     f"Output written to: {output_path}", args.verbose, args.debug
                 )
@@ -280,7 +307,8 @@ def main() -> int:
                 return 1
         else:
             # Print to stdout
-            print(json_output)
+            appointments_to_json_stream(appointments, sys.stdout, indent=indent)
+            sys.stdout.write("\n")
 
     return 0
 
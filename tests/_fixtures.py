@@ -0,0 +1,48 @@
+"""
+Shared HL7 Test Fixtures
+
+Segments that many tests repeat are defined here once, so test messages
+can be assembled from them instead of copying the same literals around.
+"""
+
+# MSH headers for an SIU^S12 message
+MSH_STD = "MSH|^~\\&|S|F|R|F|20250502||SIU^S12|1|P|2.5"
+MSH_SENDER = "MSH|^~\\&|SENDER|FAC|REC|FAC|20250502130000||SIU^S12|123|P|2.5"
+
+# SCH template: placer ID, filler ID, reason (SCH-7), location (SCH-9), start time
+SCH_FMT = "SCH|{aid}|{fid}|||||{reason}||{loc}||{dt}"
+
+# Complete PID for patient P12345, John Doe
+PID_DOE = "PID|1||P12345||Doe^John||19850210|M"
+
+
+def sch(
+    aid: str = "123",
+    fid: str = "456",
+    reason: str = "",
+    loc: str = "Loc",
+    dt: str = "20250502130000",
+) -> str:
+    """
+    Build an SCH segment, filling the unused fields with empty ones.
+
+    Example:
+        sch(reason="Checkup")
+        # Returns "SCH|123|456|||||Checkup||Loc||20250502130000"
+    """
+    return SCH_FMT.format(aid=aid, fid=fid, reason=reason, loc=loc, dt=dt)
+
+
+# Minimal SCH with appointment ID 456, a location and a start time
+SCH_STD = sch()
+
+
+def build_message(*segments: str, msh: str = MSH_STD, sch: str = SCH_STD) -> str:
+    """
+    Build an SIU message from an MSH, an SCH and any extra segments.
+
+    Example:
+        build_message(PID_DOE)
+        # Returns MSH_STD + "\\n" + SCH_STD + "\\n" + PID_DOE
+    """
+    return "\n".join((msh, sch) + segments)
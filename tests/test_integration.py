@@ -0,0 +1,872 @@
+"""
+Integration Tests for the HL7 SIU S12 Appointment Parser
+
+Covers full message parsing through parse_hl7_message, file and stream
+parsing, JSON output, and real-world edge cases:
+- Correct parsing of valid SIU messages
+- Graceful handling of missing fields
+- Behavior with malformed input
+
+Run tests with: python -m pytest tests/test_integration.py -v
+Or: python -m unittest tests.test_integration
+"""
+
+import unittest
+import sys
+import copy
+import json
+import tempfile
+import os
+import pickle
+import io
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from hl7_parser.parser import (
+    parse_hl7_message,
+    parse_hl7_file,
+    parse_single_message,
+    split_hl7_file_into_messages,
+    validate_message_type,
+    parse_hl7_file_streaming,
+    iter_file_messages,
+    parse_hl7_bytes,
+    parse_hl7_file_with_errors,
+    _iter_frames,
+    _parse_hl7_stream,
+    appointments_to_json,
+    appointments_to_json_stream,
+)
+from hl7_parser.models import Appointment, Patient, Provider
+from hl7_parser.exceptions import (
+    InvalidMessageTypeError,
+    MissingSegmentError,
+    MalformedSegmentError,
+    InvalidHL7FormatError,
+)
+from tests._fixtures import (
+    MSH_STD,
+    MSH_SENDER,
+    PID_DOE,
+    build_message,
+    sch,
+)
+
+
+class FlaggedPatient(Patient):
+    """Patient subclass, as applications may define to extend the models."""
+
+
+class TestValidateMessageType(unittest.TestCase):
+    """Tests for message type validation."""
+
+    def test_valid_siu_s12(self):
+        """Test validation passes for SIU^S12."""
+        msh_data = {"message_type": "SIU^S12"}
+        # Should not raise
+        validate_message_type(msh_data)
+
+    def test_siu_s12_with_structure(self):
+        """Test validation passes for SIU^S12^SIU_S12."""
+        msh_data = {"message_type": "SIU^S12^SIU_S12"}
+        # Should not raise
+        validate_message_type(msh_data)
+
+    def test_lowercase_siu_s12(self):
+        """Test validation is case-insensitive."""
+        msh_data = {"message_type": "siu^s12"}
+        # Should not raise
+        validate_message_type(msh_data)
+
+    def test_invalid_message_type(self):
+        """Test validation fails for non-SIU messages."""
+        msh_data = {"message_type": "ADT^A01"}
+
+        with self.assertRaises(InvalidMessageTypeError):
+            validate_message_type(msh_data)
+
+
+class TestExceptions(unittest.TestCase):
+    """Tests for the custom exception types."""
+
+    def test_error_messages(self):
+        """Test that error details are formatted into the message."""
+        self.assertEqual(
+            str(InvalidMessageTypeError("SIU^S12", "ADT^A01")),
+            "Invalid message type. Expected 'SIU^S12', got 'ADT^A01'",
+        )
+        self.assertEqual(
+            str(MissingSegmentError("SCH")),
+            "Required segment 'SCH' is missing from the message",
+        )
+        self.assertEqual(
+            str(MalformedSegmentError("SCH", "Missing appointment ID")),
+            "Malformed segment 'SCH': Missing appointment ID",
+        )
+        self.assertEqual(
+            str(InvalidHL7FormatError("File is empty")),
+            "Invalid HL7 format: File is empty",
+        )
+
+    def test_errors_survive_pickling(self):
+        """Test that exceptions can be pickled, e.g. across processes."""
+        error = pickle.loads(pickle.dumps(MalformedSegmentError("PID", "Bad")))
+
+        self.assertEqual(error.segment_name, "PID")
+        self.assertEqual(error.reason, "Bad")
+
+
+class TestParseHL7Message(unittest.TestCase):
+    """Integration tests for full message parsing."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Parse the messages shared by read-only tests once per class."""
+        cls.full_message = cls._create_basic_message()
+        cls.full_appointment = parse_hl7_message(cls.full_message)
+
+        cls.no_pid_appointment = parse_hl7_message(
+            build_message(
+                "PV1|1|O|Clinic B||||D11111^Jones^Dr",
+                msh=MSH_SENDER,
+                sch=sch("123456", "456789", "Checkup", "Clinic B", "20250502140000"),
+            )
+        )
+
+        cls.no_pv1_appointment = parse_hl7_message(
+            build_message(
+                "PID|1||P99999||Brown^Alice||19950505|F",
+                msh=MSH_SENDER,
+                sch=sch("123456", "456789", "Checkup", "Clinic C", "20250502150000"),
+            )
+        )
+
+    @classmethod
+    def _create_basic_message(
+        cls,
+        appointment_id="123456",
+        patient_id="P12345",
+        first_name="John",
+        last_name="Doe",
+        provider_id="D67890",
+        provider_name="Smith^Dr",
+        reason="Consultation",
+        datetime="20250502130000",
+    ):
+        """Helper method to create a basic HL7 message with customizable fields."""
+        return f"""{MSH_SENDER}
+SCH|123456|{appointment_id}|||||{reason}||Clinic A||{datetime}
+PID|1||{patient_id}||{last_name}^{first_name}||19850210|M
+PV1|1|O|Clinic A||||{provider_id}^{provider_name}"""
+
+    def test_parse_complete_message(self):
+        """Test parsing a complete valid SIU^S12 message."""
+        self.assertEqual(
+            self.full_appointment.to_dict(),
+            {
+                "appointment_id": "123456",
+                "appointment_datetime": "2025-05-02T13:00:00Z",
+                "patient": {
+                    "id": "P12345",
+                    "first_name": "John",
+                    "last_name": "Doe",
+                    "dob": "1985-02-10",
+                    "gender": "M",
+                },
+                "provider": {"id": "D67890", "name": "Dr Smith"},
+                "location": "Clinic A",
+                "reason": "Consultation",
+            },
+        )
+
+    def test_parse_message_without_pid(self):
+        """Test parsing message without PID segment."""
+        appointment = self.no_pid_appointment
+
+        self.assertEqual(appointment.appointment_id, "456789")
+        self.assertIsNone(appointment.patient)
+        self.assertIsNotNone(appointment.provider)
+
+    def test_parse_message_without_pv1(self):
+        """Test parsing message without PV1 segment."""
+        appointment = self.no_pv1_appointment
+
+        self.assertEqual(appointment.appointment_id, "456789")
+        self.assertIsNotNone(appointment.patient)
+        self.assertIsNone(appointment.provider)
+
+    def test_first_repeated_segment_is_used(self):
+        """Test that a repeated PID does not override the first one."""
+        message = build_message("PID|1||P111||Doe^John", "PID|2||P222||Roe^Jane")
+
+        self.assertEqual(parse_hl7_message(message).patient.id, "P111")
+
+    def test_parse_message_with_custom_delimiters(self):
+        """Test parsing a message that declares non-standard delimiters."""
+        message = """MSH#$~\\&#SENDER#FAC#REC#FAC#20250502130000##SIU$S12#123#P#2.5
+SCH#123456#456789#####Checkup##Clinic B##20250502140000
+PID#1##P12345##Doe$John##19850210#M"""
+
+        appointment = parse_hl7_message(message)
+
+        self.assertEqual(appointment.appointment_id, "456789")
+        self.assertEqual(appointment.patient.first_name, "John")
+
+    def test_custom_delimiters_keep_standard_characters_in_values(self):
+        """Test that "|" and "^" inside custom-delimited fields are kept as text."""
+        message = """MSH#$~\\&#SENDER#FAC#REC#FAC#20250502130000##SIU$S12#123#P#2.5
+SCH#123456#456789#####Follow-up | a^b##Room 1||2##20250502140000
+PID#1##P12345##Doe$John##19850210#M"""
+
+        appointment = parse_hl7_message(message)
+
+        self.assertEqual(appointment.reason, "Follow-up | a^b")
+        self.assertEqual(appointment.location, "Room 1||2")
+        self.assertEqual(appointment.patient.last_name, "Doe")
+
+    def test_custom_delimiters_wrong_type_reports_declared_value(self):
+        """Test that the error shows MSH-9 as the sender wrote it."""
+        message = "MSH#$~\\&#SENDER#FAC#REC#FAC#20250502##ADT$A01#123#P#2.5"
+
+        with self.assertRaises(InvalidMessageTypeError) as ctx:
+            parse_hl7_message(message)
+
+        self.assertIn("ADT$A01", str(ctx.exception))
+
+    def test_parse_empty_message(self):
+        """Test that empty message raises error."""
+        with self.assertRaises(InvalidHL7FormatError):
+            parse_hl7_message("")
+
+    def test_parse_wrong_message_type(self):
+        """Test that wrong message type raises error."""
+        message = """MSH|^~\\&|SENDER|FAC|REC|FAC|20250502||ADT^A01|123|P|2.5
+PID|1||P12345||Test^Patient"""
+
+        with self.assertRaises(InvalidMessageTypeError):
+            parse_hl7_message(message)
+
+    def test_parse_missing_msh(self):
+        """Test that missing MSH raises error."""
+        message = """SCH|123456|456789|||||Checkup|||Clinic||20250502150000
+PID|1||P12345||Test^Patient"""
+
+        with self.assertRaises(MissingSegmentError):
+            parse_hl7_message(message)
+
+    def test_parse_missing_sch(self):
+        """Test that missing SCH raises error."""
+        message = """MSH|^~\\&|SENDER|FAC|REC|FAC|20250502||SIU^S12|123|P|2.5
+PID|1||P12345||Test^Patient"""
+
+        with self.assertRaises(MissingSegmentError):
+            parse_hl7_message(message)
+
+    def test_parse_single_message(self):
+        """Test parsing using parse_single_message function."""
+        appointment1 = self.full_appointment
+        appointment2 = parse_single_message(self.full_message)
+
+        self.assertEqual(appointment1.appointment_id, appointment2.appointment_id)
+        self.assertEqual(appointment1.patient.id, appointment2.patient.id)
+
+    def test_parse_malformed_sch_missing_datetime(self):
+        """Test that SCH segment without valid datetime raises MalformedSegmentError."""
+        # SCH segment missing appointment datetime at position 11
+        message = """MSH|^~\&|SENDER|FAC|REC|FAC|20250502||SIU^S12|123|P|2.5
+SCH|123456|456789|||||Checkup|||Clinic
+PID|1||P12345||Test^Patient"""
+
+        with self.assertRaises(MalformedSegmentError) as context:
+            parse_hl7_message(message)
+
+        # Verify it's specifically about the datetime
+        self.assertIn("datetime", str(context.exception).lower())
+
+    def test_parse_sch_missing_appointment_id(self):
+        """Test that SCH segment without appointment ID raises MalformedSegmentError."""
+        # SCH segment with empty appointment IDs
+        message = """MSH|^~\&|SENDER|FAC|REC|FAC|20250502||SIU^S12|123|P|2.5
+SCH|||||||Checkup|||Clinic||20250502150000
+PID|1||P12345||Test^Patient"""
+
+        with self.assertRaises(MalformedSegmentError) as context:
+            parse_hl7_message(message)
+
+        # Verify it's specifically about the appointment ID
+        self.assertIn("appointment id", str(context.exception).lower())
+
+
+class TestSplitHL7FileIntoMessages(unittest.TestCase):
+    """Tests for splitting files with multiple messages."""
+
+    def test_split_single_message(self):
+        """Test file with single message."""
+        content = """MSH|^~\\&|A|B|C|D|20250502||SIU^S12|1|P|2.5
+SCH|1||||||Reason||Loc||20250502130000
+PID|1||P1||Doe^John"""
+
+        messages = list(split_hl7_file_into_messages(content))
+        self.assertEqual(len(messages), 1)
+
+    def test_split_multiple_messages(self):
+        """Test file with multiple messages separated by blank lines."""
+        content = """MSH|^~\\&|A|B|C|D|20250502||SIU^S12|1|P|2.5
+SCH|1||||||Reason||Loc||20250502130000
+PID|1||P1||Doe^John
+
+MSH|^~\\&|A|B|C|D|20250502||SIU^S12|2|P|2.5
+SCH|2||||||Reason2||Loc2||20250502140000
+PID|1||P2||Smith^Jane"""
+
+        messages = list(split_hl7_file_into_messages(content))
+        self.assertEqual(len(messages), 2)
+
+    def test_split_multiple_messages_no_blank_lines(self):
+        """Test multiple messages where each MSH starts a new message."""
+        content = """MSH|^~\\&|A|B|C|D|20250502||SIU^S12|1|P|2.5
+SCH|1||||||Reason||Loc||20250502130000
+MSH|^~\\&|A|B|C|D|20250502||SIU^S12|2|P|2.5
+SCH|2||||||Reason2||Loc2||20250502140000"""
+
+        messages = list(split_hl7_file_into_messages(content))
+        self.assertEqual(len(messages), 2)
+
+    def test_split_mllp_framed_and_indented_messages(self):
+        """Test that MSH lines after framing bytes or blanks start a message."""
+        messages = [build_message(sch=sch(fid=str(i))) for i in range(3)]
+        framed = "".join(f"\x0b{message}\x1c\r" for message in messages)
+        indented = "\n".join(
+            "  " + message.replace("\n", "\n  ") for message in messages
+        )
+
+        for content in (framed, indented):
+            with self.subTest(content=content[:8]):
+                split = list(split_hl7_file_into_messages(content))
+                self.assertEqual(len(split), 3)
+                self.assertTrue(all(m.startswith("MSH|") for m in split))
+
+    def test_split_matches_file_framing(self):
+        """Test that splitting a string frames messages like the file reader."""
+        messages = [build_message(sch=sch(fid=str(i))) for i in range(3)]
+        content = (
+            f"\x0b{messages[0]}\x1c\r\r\n"
+            f"  {messages[1]}|note MSH|inline\r\n\n"
+            f"\t{messages[2].replace(chr(10), chr(13))}\n"
+        )
+
+        split = list(split_hl7_file_into_messages(content))
+        framed = [m.strip() for m in _iter_frames(io.StringIO(content))]
+
+        self.assertEqual(len(split), 3)
+        self.assertEqual(split, framed)
+
+
+class TestParseHL7FileStreaming(unittest.TestCase):
+    """Tests for streaming file parsing functionality."""
+
+    def _create_temp_hl7_file(self, content):
+        """Helper method to create a temporary HL7 file."""
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".hl7", delete=False) as f:
+            f.write(content)
+            temp_path = f.name
+
+        return temp_path
+
+    def _cleanup_temp_file(self, temp_path):
+        """Helper method to clean up temporary file."""
+
+        os.unlink(temp_path)
+
+    def test_stream_single_message(self):
+        """Test streaming parsing of a file with single message."""
+        content = """MSH|^~\\&|A|B|C|D|20250502||SIU^S12|1|P|2.5
+SCH|1||||||Reason||Loc||20250502130000
+PID|1||P1||Doe^John"""
+
+        temp_path = self._create_temp_hl7_file(content)
+        try:
+            appointments = list(parse_hl7_file_streaming(temp_path))
+            self.assertEqual(len(appointments), 1)
+            self.assertEqual(appointments[0].appointment_id, "1")
+        finally:
+            self._cleanup_temp_file(temp_path)
+
+    def test_stream_multiple_messages(self):
+        """Test streaming parsing of a file with multiple messages."""
+        content = """MSH|^~\\&|A|B|C|D|20250502||SIU^S12|1|P|2.5
+SCH|1||||||Reason||Loc||20250502130000
+PID|1||P1||Doe^John
+
+MSH|^~\\&|A|B|C|D|20250502||SIU^S12|2|P|2.5
+SCH|2||||||Reason2||Loc2||20250502140000
+PID|1||P2||Smith^Jane"""
+
+        appointments = list(_parse_hl7_stream(io.StringIO(content)))
+        self.assertEqual(len(appointments), 2)
+        self.assertEqual(appointments[0].appointment_id, "1")
+        self.assertEqual(appointments[1].appointment_id, "2")
+
+    def test_stream_continue_on_error(self):
+        """Test streaming with continue_on_error=True."""
+        content = """MSH|^~\\&|A|B|C|D|20250502||SIU^S12|1|P|2.5
+SCH|1||||||Reason||Loc||20250502130000
+PID|1||P1||Doe^John
+
+MSH|^~\\&|A|B|C|D|20250502||ADT^A01|2|P|2.5
+INVALID|content
+
+MSH|^~\\&|A|B|C|D|20250502||SIU^S12|3|P|2.5
+SCH|3||||||Reason3||Loc3||20250502150000
+PID|1||P3||Brown^Bob"""
+
+        appointments = list(
+            _parse_hl7_stream(io.StringIO(content), continue_on_error=True)
+        )
+        self.assertEqual(len(appointments), 2)  # Should skip the invalid ADT message
+        self.assertEqual(appointments[0].appointment_id, "1")
+        self.assertEqual(appointments[1].appointment_id, "3")
+
+    def test_stream_collects_errors(self):
+        """Test that failed messages are reported through the errors list."""
+        content = """MSH|^~\\&|A|B|C|D|20250502||ADT^A01|1|P|2.5
+PID|1||P1||Doe^John
+
+MSH|^~\\&|A|B|C|D|20250502||SIU^S12|2|P|2.5
+SCH|2||||||Reason2||Loc2||20250502140000"""
+
+        errors = []
+        appointments = list(_parse_hl7_stream(io.StringIO(content), errors=errors))
+        self.assertEqual(len(appointments), 1)
+        self.assertEqual(len(errors), 1)
+        self.assertTrue(errors[0].startswith("Message 1:"))
+
+    def test_stream_across_read_chunks(self):
+        """Test that messages split across read chunks are reassembled."""
+        content = (
+            "MSH|^~\\&|A|B|C|D|20250502||SIU^S12|1|P|2.5\r"
+            "SCH|1||||||Reason||Loc||20250502130000\r"
+            "MSH|^~\\&|A|B|C|D|20250502||SIU^S12|2|P|2.5\r"
+            "SCH|2||||||Reason2||Loc2||20250502140000\r"
+        )
+
+        with mock.patch("hl7_parser.parser.READ_CHUNK_SIZE", 5):
+            appointments = list(_parse_hl7_stream(io.StringIO(content)))
+        self.assertEqual([a.appointment_id for a in appointments], ["1", "2"])
+
+    def test_stream_megabyte_segment(self):
+        """Test a segment far larger than one read chunk (e.g. an OBX report)."""
+        content = (
+            "MSH|^~\\&|A|B|C|D|20250502||SIU^S12|1|P|2.5\r"
+            "SCH|1||||||Reason||Loc||20250502130000\r"
+            "OBX|1|TX|NOTE||" + "x" * (1 << 20) + "\r"
+            "MSH|^~\\&|A|B|C|D|20250502||SIU^S12|2|P|2.5\r"
+            "SCH|2||||||Reason2||Loc2||20250502140000\r"
+        )
+
+        appointments = list(_parse_hl7_stream(io.StringIO(content)))
+        self.assertEqual([a.appointment_id for a in appointments], ["1", "2"])
+
+    def test_frame_ten_megabyte_file(self):
+        """Test framing a file that spans many real read chunks."""
+        message = (
+            "MSH|^~\\&|A|B|C|D|20250502||SIU^S12|{}|P|2.5\r"
+            "SCH|1|{}|||||Reason||Loc||20250502130000\r"
+            "PID|1||P12345||Doe^John||19850210|M\r"
+        )
+        count = (10 << 20) // len(message.format(0, 0))
+        temp_path = self._create_temp_hl7_file(
+            "".join(message.format(i, i) for i in range(count))
+        )
+        try:
+            messages = list(iter_file_messages(temp_path))
+            self.assertEqual(len(messages), count)
+            self.assertEqual(messages[0], message.format(0, 0))
+            self.assertEqual(messages[-1], message.format(count - 1, count - 1))
+        finally:
+            self._cleanup_temp_file(temp_path)
+
+    def test_parse_mllp_framed_file(self):
+        """Test that every message of an MLLP-framed capture is parsed."""
+        content = "".join(
+            f"\x0b{build_message(sch=sch(fid=str(i)))}\x1c\r" for i in range(5)
+        )
+        temp_path = self._create_temp_hl7_file(content)
+        try:
+            appointments = parse_hl7_file(temp_path)
+            self.assertEqual(
+                [a.appointment_id for a in appointments], ["0", "1", "2", "3", "4"]
+            )
+
+            # Read chunks that end inside the framing bytes
+            with mock.patch("hl7_parser.parser.READ_CHUNK_SIZE", 3):
+                appointments = list(_parse_hl7_stream(io.StringIO(content)))
+            self.assertEqual(len(appointments), 5)
+        finally:
+            self._cleanup_temp_file(temp_path)
+
+    def test_parse_file_with_workers(self):
+        """Test that parsing in worker processes keeps order and errors."""
+        content = (
+            "MSH|^~\\&|A|B|C|D|20250502||SIU^S12|1|P|2.5\r"
+            "SCH|1||||||Reason||Loc||20250502130000\r"
+            "MSH|^~\\&|A|B|C|D|20250502||ADT^A01|2|P|2.5\r"
+            "MSH|^~\\&|A|B|C|D|20250502||SIU^S12|3|P|2.5\r"
+            "SCH|3||||||Reason3||Loc3||20250502140000\r"
+        )
+
+        temp_path = self._create_temp_hl7_file(content)
+        try:
+            with mock.patch("hl7_parser.parser.PARALLEL_MIN_MESSAGES", 2):
+                appointments, errors = parse_hl7_file_with_errors(temp_path, workers=2)
+            self.assertEqual([a.appointment_id for a in appointments], ["1", "3"])
+            self.assertEqual(len(errors), 1)
+            self.assertTrue(errors[0].startswith("Message 2:"))
+        finally:
+            self._cleanup_temp_file(temp_path)
+
+    def test_frames_emitted_per_chunk(self):
+        """Test that complete messages are yielded before the stream ends."""
+        data = (
+            b"MSH|^~\\&|A|B|C|D|20250502||SIU^S12|1|P|2.5\r"
+            b"SCH|1||||||Reason||Loc||20250502130000\r"
+            b"MSH|^~\\&|A|B|C|D|20250502||SIU^S12|2|P|2.5\r"
+        )
+        stream = io.BytesIO(data)
+
+        with mock.patch("hl7_parser.parser.READ_CHUNK_SIZE", len(data)):
+            frames = _iter_frames(stream)
+            first = next(frames)
+            # The first message was framed from the first read alone
+            self.assertEqual(stream.tell(), len(data))
+            self.assertTrue(first.startswith("MSH|^~\\&|A|B|C|D|20250502||SIU^S12|1|"))
+            self.assertEqual(len(list(frames)), 1)
+
+
+class TestParseHL7Bytes(unittest.TestCase):
+    """Tests for parsing raw HL7 bytes."""
+
+    def test_parse_multiple_messages(self):
+        """Test parsing bytes with several messages and \\r separators."""
+        data = (
+            b"MSH|^~\\&|A|B|C|D|20250502||SIU^S12|1|P|2.5\r"
+            b"SCH|1||||||Reason||Loc||20250502130000\r"
+            b"MSH|^~\\&|A|B|C|D|20250502||ADT^A01|2|P|2.5\r"
+            b"PID|1||P2||Smith^Jane\r"
+            b"MSH|^~\\&|A|B|C|D|20250502||SIU^S12|3|P|2.5\r"
+            b"SCH|3||||||Reason3||Loc3||20250502150000\r"
+        )
+
+        appointments = parse_hl7_bytes(data)
+
+        self.assertEqual([a.appointment_id for a in appointments], ["1", "3"])
+
+    def test_parse_mllp_framed_and_indented_messages(self):
+        """Test that framing bytes or indentation before MSH keep messages apart."""
+        messages = [build_message(sch=sch(fid=str(i))) for i in range(3)]
+        framed = "".join(f"\x0b{message}\x1c\r" for message in messages)
+        indented = "\n".join(
+            "  " + message.replace("\n", "\n  ") for message in messages
+        )
+
+        for content in (framed, indented):
+            with self.subTest(content=content[:8]):
+                appointments = parse_hl7_bytes(content.encode())
+                self.assertEqual(
+                    [a.appointment_id for a in appointments], ["0", "1", "2"]
+                )
+
+    def test_parse_empty_bytes(self):
+        """Test that empty input raises error."""
+        with self.assertRaises(InvalidHL7FormatError):
+            parse_hl7_bytes(b"\n\n")
+
+
+class TestAppointmentToJson(unittest.TestCase):
+    """Tests for JSON serialization."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Parse the complete appointment shared by the read-only tests once."""
+        cls.appointment = parse_hl7_message(
+            build_message(
+                PID_DOE,
+                "PV1|1|O|Clinic A^Room 203||||D67890^Smith^Dr",
+                sch=sch(reason="General Consultation", loc="Clinic A Room 203"),
+            )
+        )
+
+    def test_to_json_complete(self):
+        """Test JSON output for complete appointment."""
+        json_output = self.appointment.to_json()
+
+        # Verify it's valid JSON and contains expected fields
+
+        data = json.loads(json_output)
+
+        self.assertEqual(data["appointment_id"], "456")
+        self.assertEqual(data["patient"]["id"], "P12345")
+        self.assertEqual(data["provider"]["name"], "Dr Smith")
+
+    def test_to_dict_excludes_none(self):
+        """Test that to_dict properly handles None values."""
+        message = build_message("PID|1||P12345||Doe^John")
+
+        appointment = parse_hl7_message(message)
+        data = appointment.to_dict()
+
+        # Reason should not be in output if it's None
+        self.assertNotIn("reason", data)
+
+    def test_json_matches_to_dict_for_subclasses(self):
+        """Test that subclasses of the models serialize like the base model."""
+        appointment = Appointment(
+            "A1",
+            "2025-05-02T13:00:00",
+            patient=FlaggedPatient("P1", "John", "Doe", gender="M"),
+        )
+
+        self.assertEqual(json.loads(appointment.to_json()), appointment.to_dict())
+
+    def test_json_keeps_required_none_fields(self):
+        """Test that required fields set to None are written as null."""
+        appointment = Appointment(
+            "A1", "2025-05-02T13:00:00", provider=Provider("D1", None)
+        )
+
+        data = json.loads(appointment.to_json())
+
+        self.assertEqual(data, appointment.to_dict())
+        self.assertIsNone(data["provider"]["name"])
+
+    def test_appointment_survives_pickling(self):
+        """Test that appointments round-trip through pickle, e.g. from workers."""
+        appointment = pickle.loads(pickle.dumps(self.appointment))
+
+        self.assertEqual(appointment, self.appointment)
+
+    def test_subclass_survives_pickling_and_copy(self):
+        """Test that model subclasses keep their type when pickled or copied."""
+        patient = FlaggedPatient("P1", "John", "Doe", dob="1985-02-10")
+
+        for restored in (pickle.loads(pickle.dumps(patient)), copy.copy(patient)):
+            with self.subTest(restored=restored):
+                self.assertIs(type(restored), FlaggedPatient)
+                self.assertEqual(restored, patient)
+
+    def test_json_stream_matches_json(self):
+        """Test that streamed JSON is identical to appointments_to_json."""
+        appointments = [self.appointment] * 3
+
+        for count in (0, 1, 3):
+            for indent in (None, 2):
+                output = io.StringIO()
+                written = appointments_to_json_stream(
+                    iter(appointments[:count]), output, indent=indent
+                )
+                self.assertEqual(written, count)
+                self.assertEqual(
+                    output.getvalue(),
+                    appointments_to_json(appointments[:count], indent=indent),
+                )
+
+
+class TestRealWorldMessages(unittest.TestCase):
+    """
+    Tests for messages with real-world quirks.
+
+    These are the tricky real-world scenarios that break naive parsers.
+    These scenarios are common in real-world HL7 feeds.
+    """
+
+    def test_fields_present_but_empty(self):
+        """
+        Test handling when fields exist but are empty (just pipes).
+
+        Real HL7 messages often have empty fields like: PID|1|||Doe^John
+        The parser should treat these as missing, not crash.
+        """
+        appointment = parse_hl7_message(build_message("PID|1||||Doe^John||||"))
+
+        # Patient should still be created with available data
+        self.assertIsNotNone(appointment.patient)
+        self.assertEqual(appointment.patient.last_name, "Doe")
+        # Empty patient_id field should result in empty string or UNKNOWN
+        self.assertIn(appointment.patient.id, ["", "UNKNOWN"])
+
+    def test_unexpected_component_separators_in_name(self):
+        """
+        Test handling of complex component structures.
+
+        Names can get weird: Doe^John^M^Jr^Dr or even worse with
+        sub-components using &. Extract what is needed
+        without choking on extra carets.
+        """
+        appointment = parse_hl7_message(
+            build_message("PID|1||P12345||Doe^John^Michael^Jr^Dr||19850210|M")
+        )
+
+        self.assertEqual(appointment.patient.last_name, "Doe")
+        self.assertEqual(appointment.patient.first_name, "John")
+        # First and last are extracted, extras are ignored
+
+    def test_extra_segments_ignored(self):
+        """
+        Test that non-standard segments (NTE, OBX, etc.) are ignored.
+
+        Real HL7 feeds often include extra segments.
+        Parser shouldn't crash, just skip them.
+        """
+        message = build_message(
+            PID_DOE,
+            "PV1|1|O|Clinic||||D67890^Smith^Dr",
+            "NTE|1||This is a note that should be ignored",
+            "OBX|1|TX|VITALS||BP: 120/80",
+            "ZZZ|custom|segment|data",
+            sch=sch(reason="Consultation", loc="Clinic"),
+        )
+
+        # Should parse without error
+        appointment = parse_hl7_message(message)
+
+        self.assertEqual(appointment.appointment_id, "456")
+        self.assertEqual(appointment.patient.id, "P12345")
+        # NTE, OBX, ZZZ data is simply not in output
+
+    def test_truncated_segments_handled_safely(self):
+        """
+        Test that short segments don't cause index errors.
+
+        Sometimes HL7 senders truncate segments at the end.
+        A PID with just: PID|1||P12345 is valid, just missing data.
+        """
+        message = build_message(
+            "PID|1||P12345",
+            "PV1|1|O",
+            sch=sch(loc="Clinic"),
+        )
+
+        appointment = parse_hl7_message(message)
+
+        # Should parse with available data
+        self.assertEqual(appointment.patient.id, "P12345")
+        self.assertEqual(appointment.patient.first_name, "")  # Missing is OK
+        self.assertIsNone(appointment.provider)  # No provider ID in short PV1
+
+    def test_complex_appointment_id_components(self):
+        """
+        Test extraction of appointment ID from complex SCH fields.
+
+        SCH-1/2 can be: 12345^PLACER_SYS^ISO or more complex.
+        Only the ID portion is extracted.
+        """
+        message = build_message(
+            PID_DOE,
+            sch=sch("PLAC123^HOSP^ISO", "FILL456^HOSP^ISO", "Checkup", "Clinic"),
+        )
+
+        appointment = parse_hl7_message(message)
+
+        # Should get filler ID (SCH-2) first component
+        self.assertEqual(appointment.appointment_id, "FILL456")
+
+    def test_invalid_message_type_caught(self):
+        """
+        Test that ADT, ORU, and other message types are rejected.
+
+        Only SIU^S12 is supported. Other types should fail explicitly
+        so callers know they sent the wrong message type.
+        """
+        # ADT message (Admit/Discharge/Transfer)
+        adt_message = """MSH|^~\\&|S|F|R|F|20250502||ADT^A01|1|P|2.5
+PID|1||P12345||Doe^John"""
+
+        with self.assertRaises(InvalidMessageTypeError) as ctx:
+            parse_hl7_message(adt_message)
+
+        self.assertEqual(ctx.exception.expected, "SIU^S12")
+        self.assertEqual(ctx.exception.actual, "ADT^A01")
+
+        # ORU message (Observation Result)
+        oru_message = """MSH|^~\\&|S|F|R|F|20250502||ORU^R01|1|P|2.5
+PID|1||P12345||Doe^John"""
+
+        with self.assertRaises(InvalidMessageTypeError):
+            parse_hl7_message(oru_message)
+
+
+class TestEdgeCases(unittest.TestCase):
+    """
+    Tests for specific edge cases.
+
+    These are the tricky real-world scenarios that break naive parsers.
+    These scenarios are common in real-world HL7 feeds.
+    """
+
+    # One template for every table-driven case below
+    TEMPLATE = "{sep}".join(
+        (
+            MSH_STD,
+            sch(aid="1", fid="2", dt="{timestamp}"),
+            "PID|1||P1||Doe^John||19850210|{gender}",
+        )
+    )
+    DEFAULTS = {"sep": "\n", "timestamp": "20250502130000", "gender": "M"}
+
+    LINE_ENDING_CASES = [
+        ("\n", "Unix line endings"),
+        ("\r\n", "Windows line endings"),
+        ("\r", "Classic HL7 (carriage return only)"),
+    ]
+
+    TIMESTAMP_CASES = [
+        # Date only (no time) - should default to midnight
+        ("20250502", "2025-05-02T00:00:00Z"),
+        # With timezone offset (should still work)
+        ("20250502130000-0500", "2025-05-02T13:00:00Z"),
+    ]
+
+    # Should handle M, F, O, U and map unknown values to U
+    GENDER_CASES = [("M", "M"), ("F", "F"), ("O", "O"), ("X", "U")]
+
+    def _parse_template(self, **fields):
+        """Parse the template with some fields overridden."""
+        return parse_hl7_message(self.TEMPLATE.format(**{**self.DEFAULTS, **fields}))
+
+    def test_various_line_ending_formats(self):
+        """
+        Test handling of different line endings.
+
+        HL7 spec says \\r but real files have \\n, \\r\\n, or mixed.
+        Had to deal with this a lot from different EMR systems.
+        """
+        for sep, description in self.LINE_ENDING_CASES:
+            with self.subTest(line_ending=description):
+                self.assertEqual(self._parse_template(sep=sep).patient.last_name, "Doe")
+
+    def test_timestamp_edge_cases(self):
+        """
+        Test various timestamp formats found in the wild.
+
+        HL7 timestamps are surprisingly inconsistent across systems.
+        """
+        for timestamp, expected in self.TIMESTAMP_CASES:
+            with self.subTest(timestamp=timestamp):
+                appt = self._parse_template(timestamp=timestamp)
+                self.assertEqual(appt.appointment_datetime, expected)
+
+    def test_gender_normalization(self):
+        """Test that gender values are normalized correctly."""
+        for gender, expected in self.GENDER_CASES:
+            with self.subTest(gender=gender):
+                self.assertEqual(
+                    self._parse_template(gender=gender).patient.gender, expected
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Performance Checks for the HL7 Parser
+
+These tests time hot paths of the parser and fail when they get slower
+than a per-call budget. Timings depend on the machine, so they are
+skipped unless the HL7_BENCH environment variable is set.
+
+Run with: HL7_BENCH=1 python -m pytest tests/test_perf.py -v
+"""
+
+import io
+import os
+import sys
+import time
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from hl7_parser.parser import _parse_hl7_stream
+from hl7_parser.segment_parsers import parse_hl7_timestamp
+from tests._fixtures import build_message, sch
+
+# Uncached timestamp parses take about 1 us on a typical machine
+TIMESTAMP_BUDGET_US = 5.0
+
+# Per-message budget for stream parsing, overridable for slower machines
+STREAM_BUDGET_US = float(os.getenv("HL7_BENCH_BUDGET_US", "200"))
+STREAM_MESSAGES = 10000
+
+
+@unittest.skipUnless(os.getenv("HL7_BENCH"), "set HL7_BENCH=1 to run benchmarks")
+class TestTimestampThroughput(unittest.TestCase):
+    """Throughput checks for timestamp normalization."""
+
+    def test_uncached_timestamp_parse(self):
+        """Test that parsing distinct timestamps stays within budget."""
+        # Distinct values, so every call misses the parse cache
+        timestamps = [
+            f"2025{month:02d}{day:02d}{hour:02d}3000"
+            for month in range(1, 13)
+            for day in range(1, 29)
+            for hour in range(24)
+        ]
+        parse = parse_hl7_timestamp.__wrapped__
+
+        start = time.perf_counter()
+        for timestamp in timestamps:
+            parse(timestamp)
+        elapsed = time.perf_counter() - start
+
+        per_call_us = elapsed / len(timestamps) * 1e6
+        self.assertLess(per_call_us, TIMESTAMP_BUDGET_US)
+
+
+@unittest.skipUnless(os.getenv("HL7_BENCH"), "set HL7_BENCH=1 to run benchmarks")
+class TestStreamThroughput(unittest.TestCase):
+    """Throughput checks for parsing a stream of messages."""
+
+    def test_parse_stream_within_budget(self):
+        """Test that a 10k-message stream parses within the per-message budget."""
+        content = "\n".join(
+            build_message(
+                f"PID|1||P{i}||Doe^John||19850210|M",
+                f"PV1|1|O|Clinic {i % 10}||||D{i % 50}^Smith^Dr",
+                sch=sch(fid=str(i), dt=f"202505{i % 28 + 1:02d}{i % 24:02d}0000"),
+            )
+            for i in range(STREAM_MESSAGES)
+        )
+
+        start = time.perf_counter()
+        count = sum(1 for _ in _parse_hl7_stream(io.StringIO(content)))
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(count, STREAM_MESSAGES)
+        per_message_us = elapsed / count * 1e6
+        self.assertLess(per_message_us, STREAM_BUDGET_US)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+"""
+Unit Tests for the Safe Field Helpers and Timestamp Normalization
+
+Covers safe_get_field, safe_get_component, parse_hl7_timestamp and
+parse_hl7_date.
+
+Run tests with: python -m pytest tests/test_safe_helpers.py -v
+Or: python -m unittest tests.test_safe_helpers
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from hl7_parser.segment_parsers import (
+    safe_get_field,
+    safe_get_component,
+    parse_hl7_timestamp,
+    parse_hl7_date,
+)
+
+
+class TestSafeGetField(unittest.TestCase):
+    """Tests for safe_get_field function."""
+
+    # (fields, index, default, expected)
+    CASES = [
+        # Field that exists
+        (["PID", "1", "P12345", "", "Doe^John"], 2, "", "P12345"),
+        # Field beyond the list length
+        (["PID", "1", "P12345"], 10, "", ""),
+        # Field that is empty
+        (["PID", "", "P12345"], 1, "", ""),
+        # Custom default value
+        (["PID", ""], 5, "DEFAULT", "DEFAULT"),
+        # Whitespace is stripped
+        (["PID", "  value  "], 1, "", "value"),
+    ]
+
+    def test_cases(self):
+        """Test safe_get_field against the case table."""
+        for fields, index, default, expected in self.CASES:
+            with self.subTest(fields=fields, index=index, default=default):
+                self.assertEqual(safe_get_field(fields, index, default), expected)
+
+
+class TestSafeGetComponent(unittest.TestCase):
+    """Tests for safe_get_component function."""
+
+    # (field, index, expected)
+    CASES = [
+        # First component
+        ("Doe^John^Michael", 0, "Doe"),
+        # Middle component
+        ("Doe^John^Michael", 1, "John"),
+        # Component beyond available components
+        ("Doe^John", 5, ""),
+        # Empty field
+        ("", 0, ""),
+        # No separator
+        ("SingleValue", 0, "SingleValue"),
+    ]
+
+    def test_cases(self):
+        """Test safe_get_component against the case table."""
+        for field, index, expected in self.CASES:
+            with self.subTest(field=field, index=index):
+                self.assertEqual(safe_get_component(field, index), expected)
+
+
+class TestParseHL7Timestamp(unittest.TestCase):
+    """Tests for HL7 timestamp parsing and normalization."""
+
+    def test_full_timestamp(self):
+        """Test parsing a complete timestamp (YYYYMMDDHHMMSS)."""
+        result = parse_hl7_timestamp("20250502130000")
+        self.assertEqual(result, "2025-05-02T13:00:00Z")
+
+    def test_timestamp_with_minutes(self):
+        """Test parsing timestamp with hours and minutes only."""
+        result = parse_hl7_timestamp("202505021430")
+        self.assertEqual(result, "2025-05-02T14:30:00Z")
+
+    def test_date_only(self):
+        """Test parsing date-only timestamp."""
+        result = parse_hl7_timestamp("20250502")
+        self.assertEqual(result, "2025-05-02T00:00:00Z")
+
+    def test_timestamp_with_timezone(self):
+        """Test parsing timestamp with timezone offset."""
+        result = parse_hl7_timestamp("20250502130000+0500")
+        self.assertEqual(result, "2025-05-02T13:00:00Z")
+
+    def test_empty_timestamp(self):
+        """Test parsing empty timestamp."""
+        result = parse_hl7_timestamp("")
+        self.assertIsNone(result)
+
+    def test_invalid_timestamp(self):
+        """Test parsing invalid timestamp."""
+        result = parse_hl7_timestamp("invalid")
+        self.assertIsNone(result)
+
+    def test_short_timestamp(self):
+        """Test parsing timestamp that's too short."""
+        result = parse_hl7_timestamp("2025")
+        self.assertIsNone(result)
+
+    def test_timestamp_out_of_range(self):
+        """Test that impossible dates and times are rejected."""
+        self.assertIsNone(parse_hl7_timestamp("20250230130000"))
+        self.assertIsNone(parse_hl7_timestamp("20250502250000"))
+        self.assertEqual(parse_hl7_timestamp("20240229"), "2024-02-29T00:00:00Z")
+
+    def test_timestamp_with_separators(self):
+        """Test that non-positional timestamps still parse via the slow path."""
+        self.assertEqual(
+            parse_hl7_timestamp("202505021430-0500"), "2025-05-02T14:30:00Z"
+        )
+        self.assertEqual(
+            parse_hl7_timestamp("2025-05-02T13:00:00"), "2025-05-02T13:00:00Z"
+        )
+
+
+class TestParseHL7Date(unittest.TestCase):
+    """Tests for HL7 date parsing."""
+
+    def test_valid_date(self):
+        """Test parsing a valid date."""
+        result = parse_hl7_date("19850210")
+        self.assertEqual(result, "1985-02-10")
+
+    def test_empty_date(self):
+        """Test parsing empty date."""
+        result = parse_hl7_date("")
+        self.assertIsNone(result)
+
+    def test_invalid_date(self):
+        """Test parsing invalid date."""
+        result = parse_hl7_date("notadate")
+        self.assertIsNone(result)
+
+    def test_date_out_of_range(self):
+        """Test that impossible dates are rejected."""
+        self.assertIsNone(parse_hl7_date("19850231"))
+        self.assertEqual(parse_hl7_date("1985-02-10"), "1985-02-10")
+
+    def test_leap_days(self):
+        """Test February 29th across the leap year rules."""
+        self.assertEqual(parse_hl7_date("20000229"), "2000-02-29")
+        self.assertEqual(parse_hl7_date("20240229"), "2024-02-29")
+        self.assertIsNone(parse_hl7_date("19000229"))
+        self.assertIsNone(parse_hl7_date("20250229"))
+        self.assertEqual(parse_hl7_date("20250131"), "2025-01-31")
+        self.assertIsNone(parse_hl7_date("20250431"))
+
+
+if __name__ == "__main__":
+    unittest.main()
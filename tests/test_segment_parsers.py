@@ -0,0 +1,283 @@
+"""
+Unit Tests for the Segment Parsers
+
+Covers parsing of individual MSH, SCH, PID and PV1 segments, splitting
+and indexing messages into segments, and reading MSH delimiters.
+
+Run tests with: python -m pytest tests/test_segment_parsers.py -v
+Or: python -m unittest tests.test_segment_parsers
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from hl7_parser.segment_parsers import (
+    parse_msh_segment,
+    parse_sch_segment,
+    parse_pid_segment,
+    parse_pv1_segment,
+    split_message_into_segments,
+    get_segment,
+    get_all_segments,
+    index_segments,
+    split_message_into_indexed_segments,
+    read_msh_delimiters,
+)
+from tests._fixtures import (
+    PID_DOE,
+    build_message,
+)
+
+
+def _pick(result, expected):
+    """Return the entries of a parsed segment dict for the keys in expected."""
+    return {key: result[key] for key in expected}
+
+
+class TestParseMSHSegment(unittest.TestCase):
+    """Tests for MSH segment parsing."""
+
+    def test_parse_valid_msh(self):
+        """Test parsing a valid MSH segment."""
+        segment = "MSH|^~\\&|SENDER|FACILITY|RECEIVER|DEST|20250502130000||SIU^S12|MSG001|P|2.5"
+        result = parse_msh_segment(segment)
+
+        expected = {
+            "message_type": "SIU^S12",
+            "message_control_id": "MSG001",
+            "sending_application": "SENDER",
+        }
+        self.assertEqual(_pick(result, expected), expected)
+
+    def test_parse_minimal_msh(self):
+        """Test parsing MSH with minimal fields."""
+        segment = "MSH|^~\\&|||||||SIU^S12"
+        result = parse_msh_segment(segment)
+
+        self.assertEqual(result["message_type"], "SIU^S12")
+
+
+class TestParseSCHSegment(unittest.TestCase):
+    """Tests for SCH segment parsing."""
+
+    def test_parse_valid_sch(self):
+        """Test parsing a valid SCH segment."""
+        segment = "SCH|123456|456789|||||Consultation||Clinic A||20250502130000"
+        result = parse_sch_segment(segment)
+
+        expected = {
+            "appointment_id": "456789",
+            "appointment_datetime": "2025-05-02T13:00:00Z",
+            "reason": "Consultation",
+        }
+        self.assertEqual(_pick(result, expected), expected)
+
+    def test_parse_sch_with_placer_id_only(self):
+        """Test SCH parsing when only placer ID is present."""
+        segment = "SCH|PLACER123||||||Checkup|||20250503100000"
+        result = parse_sch_segment(segment)
+
+        self.assertEqual(result["appointment_id"], "PLACER123")
+
+    def test_parse_sch_with_complex_id(self):
+        """Test SCH parsing when ID has components."""
+        segment = "SCH|123^PLACER_SYS|456^FILLER_SYS|||||Follow-up|||20250504090000"
+        result = parse_sch_segment(segment)
+
+        # Should get just the ID portion, not the full component
+        self.assertEqual(result["appointment_id"], "456")
+
+    def test_repeated_values_are_shared(self):
+        """Test that equal reasons and locations share one string object."""
+        first = parse_sch_segment("SCH|1||||||Checkup||Clinic A||20250502130000")
+        second = parse_sch_segment("SCH|2||||||Checkup||Clinic A||20250503130000")
+
+        self.assertIs(first["reason"], second["reason"])
+        self.assertIs(first["location"], second["location"])
+
+
+class TestParsePIDSegment(unittest.TestCase):
+    """Tests for PID segment parsing."""
+
+    def test_parse_valid_pid(self):
+        """Test parsing a valid PID segment."""
+        segment = "PID|1||P12345||Doe^John^Michael||19850210|M"
+        result = parse_pid_segment(segment)
+
+        expected = {
+            "patient_id": "P12345",
+            "first_name": "John",
+            "last_name": "Doe",
+            "dob": "1985-02-10",
+            "gender": "M",
+        }
+        self.assertEqual(_pick(result, expected), expected)
+
+    def test_parse_pid_female_gender(self):
+        """Test PID parsing with female gender."""
+        segment = "PID|1||P99999||Smith^Jane||19901015|F"
+        result = parse_pid_segment(segment)
+
+        self.assertEqual(result["gender"], "F")
+
+    def test_parse_pid_missing_fields(self):
+        """Test PID parsing with missing optional fields."""
+        segment = "PID|1||P12345||Doe^John"
+        result = parse_pid_segment(segment)
+
+        expected = {
+            "patient_id": "P12345",
+            "first_name": "John",
+            "last_name": "Doe",
+            "dob": None,
+        }
+        self.assertEqual(_pick(result, expected), expected)
+
+
+class TestParsePV1Segment(unittest.TestCase):
+    """Tests for PV1 segment parsing."""
+
+    def test_parse_valid_pv1(self):
+        """Test parsing a valid PV1 segment."""
+        segment = "PV1|1|O|Clinic A^Room 203||||D67890^Smith^Dr"
+        result = parse_pv1_segment(segment)
+
+        expected = {
+            "provider_id": "D67890",
+            "provider_name": "Dr Smith",
+            "location": "Clinic A Room 203",
+        }
+        self.assertEqual(_pick(result, expected), expected)
+
+    def test_parse_pv1_minimal(self):
+        """Test parsing PV1 with minimal data."""
+        segment = "PV1|1|O"
+        result = parse_pv1_segment(segment)
+
+        expected = {"provider_id": "", "provider_name": ""}
+        self.assertEqual(_pick(result, expected), expected)
+
+
+class TestSplitMessageIntoSegments(unittest.TestCase):
+    """Tests for message splitting functionality."""
+
+    def test_split_with_newlines(self):
+        """Test splitting message with \\n separators."""
+        message = "MSH|test\nPID|test\nPV1|test"
+        segments = split_message_into_segments(message)
+
+        self.assertEqual(len(segments), 3)
+        self.assertTrue(segments[0].startswith("MSH"))
+
+    def test_split_with_carriage_returns(self):
+        """Test splitting message with \\r separators."""
+        message = "MSH|test\rPID|test\rPV1|test"
+        segments = split_message_into_segments(message)
+
+        self.assertEqual(len(segments), 3)
+
+    def test_split_with_crlf(self):
+        """Test splitting message with \\r\\n separators."""
+        message = "MSH|test\r\nPID|test\r\nPV1|test"
+        segments = split_message_into_segments(message)
+
+        self.assertEqual(len(segments), 3)
+
+    def test_split_filters_empty_lines(self):
+        """Test that empty lines are filtered out."""
+        message = "MSH|test\n\n\nPID|test"
+        segments = split_message_into_segments(message)
+
+        self.assertEqual(len(segments), 2)
+
+
+class TestGetSegment(unittest.TestCase):
+    """Tests for segment retrieval functionality."""
+
+    def test_get_existing_segment(self):
+        """Test getting a segment that exists."""
+        segments = ["MSH|data", "PID|patient", "PV1|visit"]
+        result = get_segment(index_segments(segments), "PID")
+
+        self.assertEqual(result, "PID|patient")
+
+    def test_get_nonexistent_segment(self):
+        """Test getting a segment that doesn't exist."""
+        segments = ["MSH|data", "PID|patient"]
+        result = get_segment(index_segments(segments), "SCH")
+
+        self.assertIsNone(result)
+
+    def test_first_repeated_segment_wins(self):
+        """Test that the first segment is returned when a name repeats."""
+        message = build_message("PID|1||P111||Doe^John", "PID|2||P222||Roe^Jane")
+        segment_index = split_message_into_indexed_segments(message)
+
+        self.assertEqual(get_segment(segment_index, "PID"), "PID|1||P111||Doe^John")
+
+    def test_indexed_split_matches_split_then_index(self):
+        """Test that the one-pass split builds the same index as two passes."""
+        messages = [
+            build_message(PID_DOE, "NTE|1", "NTE|2"),
+            "MSH|data\r\n\r\n  PID|patient  \rNTEX|other\rNTE\n",
+            " \r\n ",
+            "",
+        ]
+
+        for message in messages:
+            with self.subTest(message=message):
+                self.assertEqual(
+                    split_message_into_indexed_segments(message),
+                    index_segments(split_message_into_segments(message)),
+                )
+
+    def test_get_all_repeating_segments(self):
+        """Test that repeating segments are returned in message order."""
+        segments = ["MSH|data", "NTE|1", "NTEX|other", "NTE", "NTE|3"]
+        segment_index = index_segments(segments)
+
+        self.assertEqual(
+            get_all_segments(segment_index, "NTE"), ["NTE|1", "NTE", "NTE|3"]
+        )
+        self.assertEqual(get_all_segments(segment_index, "OBX"), [])
+
+    def test_lookup_accepts_segment_list(self):
+        """Test that a plain segment list still works without an index."""
+        segments = ["MSH|data", "NTE|1", "PID|patient", "NTE|2"]
+
+        self.assertEqual(get_segment(segments, "PID"), "PID|patient")
+        self.assertIsNone(get_segment(segments, "SCH"))
+        self.assertEqual(get_all_segments(segments, "NTE"), ["NTE|1", "NTE|2"])
+
+    def test_get_all_segments_returns_copy(self):
+        """Test that changing the result leaves the index untouched."""
+        segment_index = index_segments(["MSH|data", "NTE|1"])
+
+        get_all_segments(segment_index, "NTE").append("NTE|2")
+
+        self.assertEqual(segment_index["NTE"], ["NTE|1"])
+
+
+class TestReadMSHDelimiters(unittest.TestCase):
+    """Tests for reading the delimiters declared in MSH."""
+
+    def test_read_standard_delimiters(self):
+        """Test reading the standard field separator and encoding characters."""
+        self.assertEqual(read_msh_delimiters("MSH|^~\\&|APP"), ("|", "^~\\&", 8))
+
+    def test_read_custom_delimiters(self):
+        """Test reading delimiters a sender declares in MSH-1/MSH-2."""
+        self.assertEqual(read_msh_delimiters("MSH#$~\\&#APP\rPID#1"), ("#", "$~\\&", 8))
+
+    def test_read_without_msh(self):
+        """Test that a message not starting with MSH has no delimiters."""
+        self.assertIsNone(read_msh_delimiters("PID|1||P1"))
+        self.assertIsNone(read_msh_delimiters("MSH\rPID|1"))
+
+
+if __name__ == "__main__":
+    unittest.main()